@@ -0,0 +1,111 @@
+"""add_room_storage_counter
+
+Revision ID: ef4567890123
+Revises: de3456789012
+Create Date: 2026-10-16 12:00:00.000000
+
+Creates room_storage counter table for Library Tool storage quotas.
+
+The counter is kept in sync by triggers on the document table, so quota
+checks and storage stats read one row instead of summing every document
+in the room. Its version column is bumped on every document write and
+keys the in-process document list cache. PostgreSQL only; on other
+databases the table is not created and get_room_storage_usage() falls
+back to aggregating the document table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ef4567890123'
+down_revision: Union[str, Sequence[str], None] = 'de3456789012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create room_storage table, triggers, and backfill existing rooms."""
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    op.create_table(
+        'room_storage',
+        sa.Column('room_id', sa.Integer(), nullable=False),
+        sa.Column('total_bytes', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('file_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['room_id'], ['room.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('room_id')
+    )
+
+    # Adjust the counter by the size of each inserted/deleted/resized document
+    # and bump the version on any document write
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_room_storage()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO room_storage (room_id, total_bytes, file_count, version)
+                VALUES (NEW.room_id, NEW.file_size, 1, 1)
+                ON CONFLICT (room_id) DO UPDATE
+                SET total_bytes = room_storage.total_bytes + EXCLUDED.total_bytes,
+                    file_count = room_storage.file_count + 1,
+                    version = room_storage.version + 1;
+                RETURN NEW;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE room_storage
+                SET total_bytes = GREATEST(0, total_bytes - OLD.file_size),
+                    file_count = GREATEST(0, file_count - 1),
+                    version = version + 1
+                WHERE room_id = OLD.room_id;
+                RETURN OLD;
+            ELSE
+                UPDATE room_storage
+                SET total_bytes = GREATEST(0, total_bytes - OLD.file_size + NEW.file_size),
+                    version = version + 1
+                WHERE room_id = NEW.room_id;
+                RETURN NEW;
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER document_room_storage_insert_delete
+        AFTER INSERT OR DELETE ON document
+        FOR EACH ROW
+        EXECUTE FUNCTION update_room_storage();
+    """)
+
+    op.execute("""
+        CREATE TRIGGER document_room_storage_update
+        AFTER UPDATE ON document
+        FOR EACH ROW
+        EXECUTE FUNCTION update_room_storage();
+    """)
+
+    # Backfill counters for rooms that already have documents
+    op.execute("""
+        INSERT INTO room_storage (room_id, total_bytes, file_count, version)
+        SELECT room_id, COALESCE(SUM(file_size), 0), COUNT(id), 1
+        FROM document
+        GROUP BY room_id
+        ON CONFLICT (room_id) DO NOTHING;
+    """)
+
+
+def downgrade() -> None:
+    """Drop room_storage triggers and table."""
+    conn = op.get_bind()
+    if conn.dialect.name != 'postgresql':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS document_room_storage_update ON document;")
+    op.execute("DROP TRIGGER IF EXISTS document_room_storage_insert_delete ON document;")
+    op.execute("DROP FUNCTION IF EXISTS update_room_storage();")
+    op.drop_table('room_storage')
@@ -0,0 +1,36 @@
+"""add_message_chat_timestamp_index
+
+Revision ID: fa5678901234
+Revises: ef4567890123
+Create Date: 2026-10-16 13:00:00.000000
+
+Adds a (chat_id, timestamp) index on message for "latest N messages in a
+chat" lookups used by the Mind Map, Quiz, Flashcards and Narrative tools.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fa5678901234'
+down_revision: Union[str, Sequence[str], None] = 'ef4567890123'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create message (chat_id, timestamp) index."""
+    op.create_index(
+        'ix_message_chat_timestamp',
+        'message',
+        ['chat_id', 'timestamp'],
+        unique=False,
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    """Drop message (chat_id, timestamp) index."""
+    op.drop_index('ix_message_chat_timestamp', table_name='message', if_exists=True)
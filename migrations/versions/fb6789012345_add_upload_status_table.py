@@ -0,0 +1,50 @@
+"""add_upload_status_table
+
+Revision ID: fb6789012345
+Revises: fa5678901234
+Create Date: 2026-10-16 14:00:00.000000
+
+Creates upload_status table for Library Tool background uploads.
+
+Job state used to live in each app worker's memory, so with several
+gunicorn workers a poll could land on a worker that had never heard of
+the job. Rows are written when a job is queued and updated as it runs.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fb6789012345'
+down_revision: Union[str, Sequence[str], None] = 'fa5678901234'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create upload_status table."""
+    op.create_table(
+        'upload_status',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('http_status', sa.Integer(), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('tmp_path', sa.String(length=1024), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['owner_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_upload_status_owner_id', 'upload_status', ['owner_id'], unique=False)
+    op.create_index('ix_upload_status_updated_at', 'upload_status', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop upload_status table."""
+    op.drop_index('ix_upload_status_updated_at', table_name='upload_status')
+    op.drop_index('ix_upload_status_owner_id', table_name='upload_status')
+    op.drop_table('upload_status')
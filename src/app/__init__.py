@@ -25,6 +25,15 @@ def rate_limit_key_func():
         return None  # None key means no rate limiting
     return get_remote_address()
 
+def user_rate_limit_key_func():
+    """Rate limit key for authenticated endpoints: the session user, else the client IP."""
+    from flask import session
+    # Users behind a shared NAT/proxy must not exhaust each other's quota
+    user_id = session.get('user_id')
+    if user_id is not None:
+        return f"user:{user_id}"
+    return get_remote_address()
+
 # Create rate limiter instance
 limiter = Limiter(
     key_func=rate_limit_key_func,
@@ -78,6 +87,10 @@ def create_app(config_name=None):
     app.config.from_object(config[config_name])
     config[config_name].init_app(app)
 
+    # Faster jsonify()/request.get_json() when orjson is installed
+    from src.app.json_provider import init_json_provider
+    init_json_provider(app)
+
     # Initialize database
     db.init_app(app)
 
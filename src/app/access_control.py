@@ -27,13 +27,20 @@ def is_admin(user: Optional[User]) -> bool:
     ADMIN_EMAILS should be a comma-separated list of email addresses.
     Matching is case-insensitive and trimmed.
     """
-    if not user or not getattr(user, 'email', None):
+    if not user:
+        return False
+    return is_admin_email(getattr(user, 'email', None))
+
+
+def is_admin_email(email: Optional[str]) -> bool:
+    """Check an email address against the ADMIN_EMAILS allowlist (see is_admin)."""
+    if not email:
         return False
     allowlist = os.getenv('ADMIN_EMAILS', '')
     if not allowlist:
         return False
     emails = [e.strip().lower() for e in allowlist.split(',') if e.strip()]
-    return user.email.strip().lower() in emails
+    return email.strip().lower() in emails
 
 
 def require_admin(f):
@@ -3,6 +3,24 @@ Goal generation module for AI Collab Online
 Extracted from room.py to improve maintainability and enable goal categorization
 """
 
+from .study_group import StudyGroupGoalGenerator, generate_study_group_goals
+
+
+def register_all() -> None:
+    """
+    Register goal generators that do not self-register on import.
+    Safe to call again, e.g. after GoalGeneratorRegistry.clear() in tests,
+    but only restores those generators (currently study-group); templates
+    that self-register on import are not re-registered.
+    """
+    from .study_group import _register as _register_study_group
+    _register_study_group()
+
+
+# Runs before .factory imports the self-registering templates, so
+# study-group keeps its original place first in get_supported_templates()
+register_all()
+
 from .factory import (
     generate_template_goals, 
     generate_categorized_goals, 
@@ -31,15 +49,21 @@ from .types import (
     TeamStructureType,
     GoalTypeType
 )
-from .study_group import StudyGroupGoalGenerator, generate_study_group_goals
 from .business_hub import BusinessHubGoalGenerator, generate_business_hub_goals
 from .creative_studio import CreativeStudioGoalGenerator, generate_creative_studio_goals
-from .writing_workshop import WritingWorkshopGoalGenerator, generate_writing_workshop_goals
+from .writing_workshop import (
+    WritingWorkshopGoalGenerator,
+    generate_writing_workshop_goals,
+    generate_writing_workshop_goals_batch,
+)
 from .learning_lab import LearningLabGoalGenerator, generate_learning_lab_goals
 from .community_space import CommunitySpaceGoalGenerator, generate_community_space_goals
 from .academic_essay import AcademicEssayGoalGenerator, generate_academic_essay_goals
 
 __all__ = [
+    # Registration
+    "register_all",
+    
     # Factory functions
     "generate_template_goals",
     "generate_categorized_goals",
@@ -79,6 +103,7 @@ __all__ = [
     "generate_creative_studio_goals",
     "WritingWorkshopGoalGenerator",
     "generate_writing_workshop_goals",
+    "generate_writing_workshop_goals_batch",
     "LearningLabGoalGenerator",
     "generate_learning_lab_goals",
     "CommunitySpaceGoalGenerator",
@@ -3,6 +3,9 @@ Base goal generation interface
 Provides common structure for all template goal generators
 """
 
+from __future__ import annotations
+
+import sys
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any
 from .types import AnswersDict, CategorizedGoals, GoalList
@@ -11,6 +14,9 @@ from .types import AnswersDict, CategorizedGoals, GoalList
 class GoalGenerator(ABC):
     """Base class for template goal generators."""
     
+    # Generators are stateless, so instances need no per-instance __dict__
+    __slots__ = ()
+    
     @abstractmethod
     def generate_goals(self, answers: AnswersDict) -> CategorizedGoals:
         """
@@ -57,3 +63,22 @@ class GoalGenerator(ABC):
             "collaboration_goals": goals[core_count:core_count + collab_count],
             "reflection_goals": goals[core_count + collab_count:]
         }
+
+
+def intern_goals(value: Any) -> Any:
+    """
+    Recursively intern goal strings in a module-level goal table.
+    Each distinct goal is then held once per process; dicts keep their keys
+    and any other sequence becomes a tuple.
+    
+    Args:
+        value: A goal string, or a dict/sequence of them
+        
+    Returns:
+        The same structure with every goal string interned
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {key: intern_goals(item) for key, item in value.items()}
+    return tuple(intern_goals(item) for item in value)
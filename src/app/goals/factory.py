@@ -3,7 +3,9 @@ Goal generation factory
 Provides backward compatibility while using the registry pattern for template discovery
 """
 
-from typing import Dict, List, Any, Callable, Optional
+from __future__ import annotations
+
+from typing import Dict, Any, Callable, Optional, Tuple
 from .base import GoalGenerator
 from .registry import GoalGeneratorRegistry
 from .types import (
@@ -79,12 +81,12 @@ def generate_categorized_goals(template_type: TemplateType, answers: AnswersDict
     }
 
 
-def get_supported_templates() -> List[TemplateType]:
+def get_supported_templates() -> Tuple[TemplateType, ...]:
     """
-    Get list of supported templates from registry.
+    Get supported templates from registry.
     
     Returns:
-        List of supported template type identifiers
+        Immutable snapshot of supported template type identifiers
     """
     return GoalGeneratorRegistry.get_supported_templates()
 
@@ -4,18 +4,32 @@ Implements the registry pattern for automatic template discovery and registratio
 Eliminates the factory anti-pattern by enabling templates to auto-register themselves.
 """
 
-from typing import Dict, Type, Optional, List
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Dict, Type, Optional, Tuple
 from .base import GoalGenerator
 from .types import TemplateType, GeneratorInstance, RegistryStats, RegistryInfo
 
 
+# Module-level storage keeps the hot lookups free of classmethod binding
+_GENERATORS: Dict[TemplateType, Type[GoalGenerator]] = {}
+
+# Generators are stateless, so one shared instance per template type is reused
+_INSTANCES: Dict[TemplateType, GoalGenerator] = {}
+
+# Snapshot of registered template types, rebuilt lazily after register/clear
+_SUPPORTED_CACHE: Optional[Tuple[TemplateType, ...]] = None
+
+# Read-only statistics snapshot, invalidated alongside _SUPPORTED_CACHE
+_STATS_CACHE: Optional[RegistryStats] = None
+
+
 class GoalGeneratorRegistry:
     """Registry for goal generators with automatic template discovery."""
     
-    _generators: Dict[TemplateType, Type[GoalGenerator]] = {}
-    
-    @classmethod
-    def register(cls, template_type: TemplateType, generator_class: Type[GoalGenerator]) -> None:
+    @staticmethod
+    def register(template_type: TemplateType, generator_class: Type[GoalGenerator]) -> None:
         """
         Register a goal generator for a template type.
         
@@ -23,10 +37,14 @@ class GoalGeneratorRegistry:
             template_type: The template type identifier (e.g., "study-group")
             generator_class: The goal generator class to register
         """
-        cls._generators[template_type] = generator_class
+        global _SUPPORTED_CACHE, _STATS_CACHE
+        _GENERATORS[template_type] = generator_class
+        _INSTANCES.pop(template_type, None)
+        _SUPPORTED_CACHE = None
+        _STATS_CACHE = None
     
-    @classmethod
-    def get_generator(cls, template_type: TemplateType) -> Optional[Type[GoalGenerator]]:
+    @staticmethod
+    def get_generator(template_type: TemplateType) -> Optional[Type[GoalGenerator]]:
         """
         Get generator class for template type.
         
@@ -36,20 +54,23 @@ class GoalGeneratorRegistry:
         Returns:
             The generator class if registered, None otherwise
         """
-        return cls._generators.get(template_type)
+        return _GENERATORS.get(template_type)
     
-    @classmethod
-    def get_supported_templates(cls) -> List[TemplateType]:
+    @staticmethod
+    def get_supported_templates() -> Tuple[TemplateType, ...]:
         """
-        Get list of all supported template types.
+        Get all supported template types.
         
         Returns:
-            List of registered template type identifiers
+            Immutable snapshot of registered template type identifiers
         """
-        return list(cls._generators.keys())
+        global _SUPPORTED_CACHE
+        if _SUPPORTED_CACHE is None:
+            _SUPPORTED_CACHE = tuple(_GENERATORS.keys())
+        return _SUPPORTED_CACHE
     
-    @classmethod
-    def is_supported(cls, template_type: TemplateType) -> bool:
+    @staticmethod
+    def is_supported(template_type: TemplateType) -> bool:
         """
         Check if template type is supported.
         
@@ -59,12 +80,13 @@ class GoalGeneratorRegistry:
         Returns:
             True if the template type is registered, False otherwise
         """
-        return template_type in cls._generators
+        return template_type in _GENERATORS
     
-    @classmethod
-    def create_generator(cls, template_type: TemplateType) -> GeneratorInstance:
+    @staticmethod
+    def create_generator(template_type: TemplateType) -> GeneratorInstance:
         """
-        Create a generator instance for the given template type.
+        Get the shared generator instance for the given template type.
+        Generators must be stateless since the instance is reused across requests.
         
         Args:
             template_type: The template type identifier
@@ -72,42 +94,51 @@ class GoalGeneratorRegistry:
         Returns:
             A generator instance if the type is supported, None otherwise
         """
-        generator_class = cls.get_generator(template_type)
-        if generator_class:
-            return generator_class()
-        return None
+        instance = _INSTANCES.get(template_type)
+        if instance is None:
+            generator_class = _GENERATORS.get(template_type)
+            if generator_class:
+                instance = _INSTANCES[template_type] = generator_class()
+        return instance
     
-    @classmethod
-    def clear(cls) -> None:
+    @staticmethod
+    def clear() -> None:
         """Clear all registered generators (mainly for testing)."""
-        cls._generators.clear()
+        global _SUPPORTED_CACHE, _STATS_CACHE
+        _GENERATORS.clear()
+        _INSTANCES.clear()
+        _SUPPORTED_CACHE = None
+        _STATS_CACHE = None
     
-    @classmethod
-    def count(cls) -> int:
+    @staticmethod
+    def count() -> int:
         """
         Get the number of registered generators.
         
         Returns:
             Number of registered template generators
         """
-        return len(cls._generators)
+        return len(_GENERATORS)
     
-    @classmethod
-    def get_stats(cls) -> RegistryStats:
+    @staticmethod
+    def get_stats() -> RegistryStats:
         """
         Get comprehensive registry statistics.
         
         Returns:
-            Registry statistics including template count and health status
-        """
-        return {
-            "total_templates": cls.count(),
-            "supported_templates": cls.get_supported_templates(),
-            "registry_health": "healthy" if cls.count() > 0 else "empty"
-        }
+            Read-only registry statistics including template count and health status
+        """
+        global _STATS_CACHE
+        if _STATS_CACHE is None:
+            _STATS_CACHE = MappingProxyType({
+                "total_templates": len(_GENERATORS),
+                "supported_templates": GoalGeneratorRegistry.get_supported_templates(),
+                "registry_health": "healthy" if _GENERATORS else "empty"
+            })
+        return _STATS_CACHE
     
-    @classmethod
-    def get_info(cls, template_type: TemplateType) -> RegistryInfo:
+    @staticmethod
+    def get_info(template_type: TemplateType) -> RegistryInfo:
         """
         Get detailed information about a specific template type.
         
@@ -117,9 +148,9 @@ class GoalGeneratorRegistry:
         Returns:
             Detailed information about the template type
         """
-        generator_class = cls.get_generator(template_type)
+        generator_class = _GENERATORS.get(template_type)
         return {
             "template_type": template_type,
             "generator_class": generator_class.__name__ if generator_class else "None",
-            "is_supported": cls.is_supported(template_type)
+            "is_supported": template_type in _GENERATORS
         }
@@ -3,7 +3,9 @@ Type definitions for the goal generation system
 Provides comprehensive type safety for all template goal generators
 """
 
-from typing import Literal, Dict, List, Any, TypedDict, Union, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, Dict, List, Any, TypedDict, Union, Optional, Tuple
 
 # Template-specific literal types
 SubjectType = Literal["math", "science", "literature", "history", "languages", "other", "general"]
@@ -25,61 +27,49 @@ CategorizedGoals = Dict[str, List[str]]
 GoalList = List[str]
 TemplateType = str
 
-# Structured types for template answers
-class StudyGroupAnswers(TypedDict, total=False):
-    subject: SubjectType
-    group_size: GroupSizeType
-    goal_type: GoalTypeType
-
-class BusinessHubAnswers(TypedDict, total=False):
-    business_type: BusinessTypeType
-    team_structure: TeamStructureType
-    focus_area: str
-
-class CreativeStudioAnswers(TypedDict, total=False):
-    medium: CreativeMediumType
-    skill_level: SkillLevelType
-    project_type: str
-    group_size: GroupSizeType
-
-class WritingWorkshopAnswers(TypedDict, total=False):
-    writing_type: WritingTypeType
-    experience_level: ExperienceLevelType
-    workshop_focus: str
-    group_size: GroupSizeType
-
-class LearningLabAnswers(TypedDict, total=False):
-    learning_style: LearningStyleType
-    subject_area: str
-    goal: str
-    group_size: GroupSizeType
-
-class CommunitySpaceAnswers(TypedDict, total=False):
-    community_type: CommunityTypeType
-    purpose: str
-    group_size: GroupSizeType
-
-class AcademicEssayAnswers(TypedDict, total=False):
-    essay_type: EssayTypeType
-    writing_focus: str
-    group_size: GroupSizeType
-
-# Union type for all possible answer types
-TemplateAnswers = Union[
-    StudyGroupAnswers,
-    BusinessHubAnswers,
-    CreativeStudioAnswers,
-    WritingWorkshopAnswers,
-    LearningLabAnswers,
-    CommunitySpaceAnswers,
-    AcademicEssayAnswers
-]
-
-# Type for goal generation results
-class GoalGenerationResult(TypedDict):
-    core_goals: List[str]
-    collaboration_goals: List[str]
-    reflection_goals: List[str]
+# Structured types for template answers. They are only used as annotations, so the
+# TypedDict classes exist for type checkers and are plain dict aliases at runtime.
+if TYPE_CHECKING:
+    class StudyGroupAnswers(TypedDict, total=False):
+        subject: SubjectType
+        group_size: GroupSizeType
+        goal_type: GoalTypeType
+
+    class BusinessHubAnswers(TypedDict, total=False):
+        business_type: BusinessTypeType
+        team_structure: TeamStructureType
+        focus_area: str
+
+    class CreativeStudioAnswers(TypedDict, total=False):
+        medium: CreativeMediumType
+        skill_level: SkillLevelType
+        project_type: str
+        group_size: GroupSizeType
+
+    class WritingWorkshopAnswers(TypedDict, total=False):
+        writing_type: WritingTypeType
+        experience_level: ExperienceLevelType
+        workshop_focus: str
+        group_size: GroupSizeType
+
+    class LearningLabAnswers(TypedDict, total=False):
+        learning_style: LearningStyleType
+        subject_area: str
+        goal: str
+        group_size: GroupSizeType
+
+    class CommunitySpaceAnswers(TypedDict, total=False):
+        community_type: CommunityTypeType
+        purpose: str
+        group_size: GroupSizeType
+
+    class AcademicEssayAnswers(TypedDict, total=False):
+        essay_type: EssayTypeType
+        writing_focus: str
+        group_size: GroupSizeType
+else:
+    StudyGroupAnswers = BusinessHubAnswers = CreativeStudioAnswers = dict
+    WritingWorkshopAnswers = LearningLabAnswers = CommunitySpaceAnswers = AcademicEssayAnswers = dict
 
 # Type for registry operations
 class RegistryInfo(TypedDict):
@@ -96,7 +86,7 @@ CategorizationResult = Dict[str, List[str]]
 # Type for template validation
 class TemplateValidation(TypedDict):
     is_valid: bool
-    supported_templates: List[TemplateType]
+    supported_templates: Tuple[TemplateType, ...]
     error_message: Optional[str]
 
 # Type for goal generation statistics
@@ -110,24 +100,43 @@ class GoalStats(TypedDict):
 # Type for registry statistics
 class RegistryStats(TypedDict):
     total_templates: int
-    supported_templates: List[TemplateType]
+    supported_templates: Tuple[TemplateType, ...]
     registry_health: str
 
-# Type for error handling
-class GoalGenerationError(TypedDict):
-    error_type: str
-    template_type: TemplateType
-    message: str
-    details: Optional[Dict[str, Any]]
-
 # Type for backward compatibility functions
 LegacyGoalFunction = Any  # Callable[[AnswersDict], GoalList]
 
 # Type for generator creation
 GeneratorInstance = Optional[Any]  # GoalGenerator | None
 
-# Type for template discovery
-class TemplateDiscovery(TypedDict):
-    discovered_templates: List[TemplateType]
-    auto_registered: bool
-    registration_count: int
+# Purely static types, only evaluated by type checkers
+if TYPE_CHECKING:
+    # Union type for all possible answer types
+    TemplateAnswers = Union[
+        StudyGroupAnswers,
+        BusinessHubAnswers,
+        CreativeStudioAnswers,
+        WritingWorkshopAnswers,
+        LearningLabAnswers,
+        CommunitySpaceAnswers,
+        AcademicEssayAnswers
+    ]
+
+    # Type for goal generation results
+    class GoalGenerationResult(TypedDict):
+        core_goals: List[str]
+        collaboration_goals: List[str]
+        reflection_goals: List[str]
+
+    # Type for error handling
+    class GoalGenerationError(TypedDict):
+        error_type: str
+        template_type: TemplateType
+        message: str
+        details: Optional[Dict[str, Any]]
+
+    # Type for template discovery
+    class TemplateDiscovery(TypedDict):
+        discovered_templates: List[TemplateType]
+        auto_registered: bool
+        registration_count: int
@@ -18,26 +18,58 @@ from flask import (
     session,
     flash,
     jsonify,
+    g,
+    has_app_context,
 )
 from flask import current_app
 import json
 import os
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
 from src.app import db
 from src.models import User, GoogleAuth
-from google_auth_oauthlib.flow import Flow
-from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 from .access_control import get_current_user, require_login
+from .google_constants import GOOGLE_AUTH_URI, GOOGLE_TOKEN_URI, OAUTH_SCOPES
 
 google_auth = Blueprint("google_auth", __name__)
 
+# Google client libraries are imported inside the functions that use them so
+# workers that never touch Google skip their import cost.
+
 # OAuth 2.0 scopes needed for Google Docs API
-SCOPES = [
-    "https://www.googleapis.com/auth/documents",
-    "https://www.googleapis.com/auth/drive.readonly",
-]
+SCOPES = OAUTH_SCOPES
+
+# OAuth client settings, read from the environment once at import
+_GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
+_GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
+_GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI")
+_GOOGLE_CLIENT_CONFIG = {
+    "web": {
+        "client_id": _GOOGLE_CLIENT_ID,
+        "client_secret": _GOOGLE_CLIENT_SECRET,
+        "auth_uri": GOOGLE_AUTH_URI,
+        "token_uri": GOOGLE_TOKEN_URI,
+        "redirect_uris": [_GOOGLE_REDIRECT_URI],
+    }
+}
+
+# Built API clients keyed by (api, version, user_id, access_token); a refreshed
+# token produces a new key, and the user's old clients are evicted explicitly.
+# Each client carries an httplib2.Http, which is not thread-safe, so every
+# thread keeps its own LRU (as google_docs.py does for its service account).
+_SERVICE_CACHE_SIZE = 64
+_thread_local = threading.local()
+
+
+def _thread_service_cache():
+    """Return this thread's LRU of built API clients."""
+    cache = getattr(_thread_local, "service_cache", None)
+    if cache is None:
+        cache = _thread_local.service_cache = OrderedDict()
+    return cache
 
 
 @google_auth.route("/connect")
@@ -53,20 +85,11 @@ def connect_google():
         return redirect(url_for("auth.profile"))
 
     # Create OAuth flow
-    flow = Flow.from_client_config(
-        {
-            "web": {
-                "client_id": os.getenv("GOOGLE_CLIENT_ID"),
-                "client_secret": os.getenv("GOOGLE_CLIENT_SECRET"),
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "redirect_uris": [os.getenv("GOOGLE_REDIRECT_URI")],
-            }
-        },
-        scopes=SCOPES,
-    )
+    from google_auth_oauthlib.flow import Flow
 
-    flow.redirect_uri = os.getenv("GOOGLE_REDIRECT_URI")
+    flow = Flow.from_client_config(_GOOGLE_CLIENT_CONFIG, scopes=SCOPES)
+
+    flow.redirect_uri = _GOOGLE_REDIRECT_URI
 
     # Store user ID in session for callback
     session["google_auth_user_id"] = user.id
@@ -93,19 +116,10 @@ def google_callback():
         return redirect(url_for("auth.login"))
 
     # Create OAuth flow
-    flow = Flow.from_client_config(
-        {
-            "web": {
-                "client_id": os.getenv("GOOGLE_CLIENT_ID"),
-                "client_secret": os.getenv("GOOGLE_CLIENT_SECRET"),
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "redirect_uris": [os.getenv("GOOGLE_REDIRECT_URI")],
-            }
-        },
-        scopes=SCOPES,
-    )
-    flow.redirect_uri = os.getenv("GOOGLE_REDIRECT_URI")
+    from google_auth_oauthlib.flow import Flow
+
+    flow = Flow.from_client_config(_GOOGLE_CLIENT_CONFIG, scopes=SCOPES)
+    flow.redirect_uri = _GOOGLE_REDIRECT_URI
 
     # Exchange authorization code for tokens
     flow.fetch_token(authorization_response=request.url)
@@ -144,6 +158,8 @@ def disconnect_google():
     if google_auth:
         db.session.delete(google_auth)
         db.session.commit()
+        _evict_user_services(user.id)
+        g.pop("_google_auth_rows", None)
         flash("Google Docs disconnected successfully.")
     else:
         flash("No Google account connected.")
@@ -151,18 +167,38 @@ def disconnect_google():
     return redirect(url_for("auth.profile"))
 
 
-def get_google_credentials(user_id):
-    """Get valid Google credentials for a user."""
-    google_auth = GoogleAuth.query.filter_by(user_id=user_id).first()
-    if not google_auth:
+def _request_auth_cache():
+    """Return the per-request GoogleAuth row cache, or None outside an app context."""
+    if not has_app_context():
         return None
+    if "_google_auth_rows" not in g:
+        g._google_auth_rows = {}
+    return g._google_auth_rows
+
+
+def _get_google_auth(user_id):
+    """Load a user's GoogleAuth row at most once per request."""
+    cache = _request_auth_cache()
+    if cache is not None and user_id in cache:
+        return cache[user_id]
+
+    google_auth = GoogleAuth.query.filter_by(user_id=user_id).first()
+    if cache is not None:
+        cache[user_id] = google_auth
+    return google_auth
+
+
+def _credentials_from_auth(google_auth):
+    """Build credentials from a GoogleAuth row, refreshing and persisting an expired token."""
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
 
     credentials = Credentials(
         token=google_auth.access_token,
         refresh_token=google_auth.refresh_token,
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=os.getenv("GOOGLE_CLIENT_ID"),
-        client_secret=os.getenv("GOOGLE_CLIENT_SECRET"),
+        token_uri=GOOGLE_TOKEN_URI,
+        client_id=_GOOGLE_CLIENT_ID,
+        client_secret=_GOOGLE_CLIENT_SECRET,
         scopes=SCOPES,
     )
 
@@ -170,27 +206,107 @@ def get_google_credentials(user_id):
     if credentials.expired and credentials.refresh_token:
         credentials.refresh(Request())
 
-        # Update stored tokens
-        google_auth.access_token = credentials.token
-        google_auth.token_expiry = credentials.expiry
-        db.session.commit()
+        # Persist the new token in its own transaction so unrelated pending
+        # changes in the request's session are neither flushed nor committed
+        with db.engine.begin() as connection:
+            connection.execute(
+                update(GoogleAuth)
+                .where(GoogleAuth.user_id == google_auth.user_id)
+                .values(access_token=credentials.token, token_expiry=credentials.expiry)
+            )
+
+        # Keep the loaded (and request-cached) row current without marking it dirty
+        set_committed_value(google_auth, "access_token", credentials.token)
+        set_committed_value(google_auth, "token_expiry", credentials.expiry)
+        _evict_user_services(google_auth.user_id)
 
     return credentials
 
 
-def get_google_docs_service(user_id):
-    """Get Google Docs API service for a user."""
-    credentials = get_google_credentials(user_id)
-    if not credentials:
+def get_google_credentials(user_id):
+    """Get valid Google credentials for a user."""
+    google_auth = _get_google_auth(user_id)
+    if not google_auth:
         return None
 
-    return build("docs", "v1", credentials=credentials)
+    return _credentials_from_auth(google_auth)
+
+
+def get_google_credentials_bulk(user_ids):
+    """Get valid Google credentials for several users with a single query.
+
+    Returns a dict of user_id -> credentials; users without a connected
+    Google account are omitted.
+    """
+    cache = _request_auth_cache()
+    missing = [
+        user_id for user_id in user_ids if cache is None or user_id not in cache
+    ]
+    rows = {}
+    if missing:
+        for google_auth in GoogleAuth.query.filter(
+            GoogleAuth.user_id.in_(missing)
+        ).all():
+            rows[google_auth.user_id] = google_auth
+        if cache is not None:
+            for user_id in missing:
+                cache[user_id] = rows.get(user_id)
+
+    credentials = {}
+    for user_id in user_ids:
+        google_auth = rows.get(user_id) if cache is None else cache.get(user_id)
+        if google_auth:
+            credentials[user_id] = _credentials_from_auth(google_auth)
+    return credentials
 
 
-def get_google_drive_service(user_id):
-    """Get Google Drive API service for a user."""
+def _evict_user_services(user_id):
+    """Drop this thread's cached API clients built from a user's previous tokens.
+
+    Other threads' copies are keyed by the old token, so they are never
+    served again and age out of their LRU.
+    """
+    cache = _thread_service_cache()
+    for key in [key for key in cache if key[2] == user_id]:
+        del cache[key]
+
+
+def _get_cached_service(api, version, user_id):
+    """Return a built API client for a user, reusing it on this thread while the access token is unchanged."""
     credentials = get_google_credentials(user_id)
     if not credentials:
         return None
 
-    return build("drive", "v3", credentials=credentials)
+    cache = _thread_service_cache()
+    key = (api, version, user_id, credentials.token)
+    service = cache.get(key)
+    if service is not None:
+        cache.move_to_end(key)
+        return service
+
+    from googleapiclient.discovery import build
+
+    # Use the discovery document bundled with googleapiclient instead of fetching it
+    service = build(
+        api,
+        version,
+        credentials=credentials,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+    cache[key] = service
+    if len(cache) > _SERVICE_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    return service
+
+
+def get_google_docs_service(user_id):
+    """Get Google Docs API service for a user."""
+    return _get_cached_service("docs", "v1", user_id)
+
+
+def get_google_drive_service(user_id):
+    """Get Google Drive API service for a user."""
+    return _get_cached_service("drive", "v3", user_id)
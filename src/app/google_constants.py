@@ -0,0 +1,17 @@
+"""Shared Google API constants.
+
+Scopes are tuples so they are immutable and hashable, which lets them be
+used directly as cache keys by credential and service builders.
+"""
+
+GOOGLE_AUTH_URI = "https://accounts.google.com/o/oauth2/auth"
+GOOGLE_TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+# OAuth 2.0 scopes requested when a user connects their Google account
+OAUTH_SCOPES: tuple = (
+    "https://www.googleapis.com/auth/documents",
+    "https://www.googleapis.com/auth/drive.readonly",
+)
+
+# Scopes for the read-only service account used to import shared documents
+SERVICE_ACCOUNT_SCOPES: tuple = ("https://www.googleapis.com/auth/documents.readonly",)
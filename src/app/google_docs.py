@@ -1,23 +1,57 @@
 import re
 import os
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import threading
+from .google_constants import SERVICE_ACCOUNT_SCOPES
 
 # Google Docs API service account credentials
-SCOPES = ["https://www.googleapis.com/auth/documents.readonly"]
+SCOPES = SERVICE_ACCOUNT_SCOPES
 SERVICE_ACCOUNT_FILE = os.getenv(
     "GOOGLE_SERVICE_ACCOUNT_FILE", "service-account-key.json"
 )
 
+_HTTP_TIMEOUT = 30
+_thread_local = threading.local()
+
+# Matches /edit, /view and bare document URLs alike
+_DOC_URL_MARKER = "docs.google.com/document/d/"
+_DOC_ID_RE = re.compile(r"docs\.google\.com/document/d/([a-zA-Z0-9_-]+)")
+
+# Partial-response mask: only the paragraph text that get_document_content reads
+_DOC_TEXT_FIELDS = "body/content/paragraph/elements/textRun/content"
+
 
 def get_google_docs_service():
-    """Get Google Docs API service using service account."""
+    """Get Google Docs API service using service account.
+
+    The service is built once per thread on its own keep-alive httplib2
+    connection (httplib2.Http is not thread-safe), so repeated document
+    fetches skip the TLS handshake and client construction.
+    """
+    service = getattr(_thread_local, "docs_service", None)
+    if service is not None:
+        return service
+
     try:
+        # Google client libraries are heavy; import them only when a document is fetched
+        import google_auth_httplib2
+        import httplib2
+        from google.oauth2 import service_account
+        from googleapiclient.discovery import build
+
         credentials = service_account.Credentials.from_service_account_file(
             SERVICE_ACCOUNT_FILE, scopes=SCOPES
         )
-        service = build("docs", "v1", credentials=credentials)
+        authorized_http = google_auth_httplib2.AuthorizedHttp(
+            credentials, http=httplib2.Http(timeout=_HTTP_TIMEOUT)
+        )
+        service = build(
+            "docs",
+            "v1",
+            http=authorized_http,
+            cache_discovery=False,
+            static_discovery=True,
+        )
+        _thread_local.docs_service = service
         return service
     except Exception as e:
         # print(f"Error setting up Google Docs service: {e}")
@@ -26,19 +60,14 @@ def get_google_docs_service():
 
 def extract_document_id(url):
     """Extract document ID from Google Docs URL."""
-    # Pattern for Google Docs URLs
-    patterns = [
-        r"docs\.google\.com/document/d/([a-zA-Z0-9_-]+)",
-        r"docs\.google\.com/document/d/([a-zA-Z0-9_-]+)/edit",
-        r"docs\.google\.com/document/d/([a-zA-Z0-9_-]+)/view",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    # Cheap literal scan first; the regex only runs from the known offset
+    start = url.find(_DOC_URL_MARKER) if url else -1
+    if start < 0:
+        return None
 
-    return None
+    # Fall back to scanning the rest if the first marker has no usable ID
+    match = _DOC_ID_RE.match(url, start) or _DOC_ID_RE.search(url, start + 1)
+    return match.group(1) if match else None
 
 
 def get_document_content(doc_id):
@@ -47,19 +76,26 @@ def get_document_content(doc_id):
     if not service:
         return None, "Google Docs service not configured"
 
+    from googleapiclient.errors import HttpError
+
     try:
-        # Get document content (main document only)
-        document = service.documents().get(documentId=doc_id).execute()
-
-        # Extract text content from the document
-        content = []
-        for element in document.get("body", {}).get("content", []):
-            if "paragraph" in element:
-                for para_element in element["paragraph"]["elements"]:
-                    if "textRun" in para_element:
-                        content.append(para_element["textRun"]["content"])
-
-        return "".join(content).strip(), None
+        # Get document content (main document only), fetching just the text runs
+        document = (
+            service.documents()
+            .get(documentId=doc_id, fields=_DOC_TEXT_FIELDS)
+            .execute()
+        )
+
+        # Extract text runs straight into the join, skipping non-paragraph elements
+        text = "".join(
+            para_element["textRun"]["content"]
+            for element in document.get("body", {}).get("content", ())
+            if "paragraph" in element
+            for para_element in element["paragraph"]["elements"]
+            if "textRun" in para_element
+        )
+
+        return text.strip(), None
 
     except HttpError as e:
         if e.resp.status == 404:
@@ -0,0 +1,61 @@
+"""
+orjson-backed JSON provider for the Flask app.
+
+Drop-in for Flask's DefaultJSONProvider: output stays compatible (sorted
+keys, HTTP-date datetimes, str() of non-str keys) but encoding and decoding
+run in orjson. Anything orjson cannot handle falls back to the stdlib path.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Route datetimes through DefaultJSONProvider.default so they keep the
+# HTTP-date format existing clients parse
+_ORJSON_OPTIONS = (
+    (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+    if orjson is not None else 0
+)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """DefaultJSONProvider that encodes and decodes with orjson."""
+
+    def _orjson_dumps(self, obj):
+        """Encode obj to bytes, or None if orjson can't (e.g. ints wider than 64 bits)."""
+        try:
+            return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            return None
+
+    def dumps(self, obj, **kwargs):
+        # Formatting and encoder options are only understood by the stdlib path
+        if not kwargs:
+            data = self._orjson_dumps(obj)
+            if data is not None:
+                return data.decode()
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Debug/non-compact output is indented, which only the stdlib path does
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        data = self._orjson_dumps(obj)
+        if data is None:
+            return super().response(obj)
+        return self._app.response_class(data + b"\n", mimetype=self.mimetype)
+
+
+def init_json_provider(app):
+    """Install OrjsonProvider on app when orjson is available."""
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
@@ -3,10 +3,98 @@ Library Tool integration blueprint
 Provides document upload, chunking, and search capabilities
 """
 
-from flask import Blueprint
+from functools import wraps
+
+from flask import Blueprint, abort, current_app, g, jsonify, request, session
 
 library = Blueprint('library', __name__, url_prefix='/api/library')
 
+
+def login_required(f):
+    """Session-based login required decorator shared by all Library Tool endpoints."""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if 'user_id' not in session:
+            return jsonify({'error': 'Authentication required'}), 401
+        return f(*args, **kwargs)
+    return decorated_function
+
+
+def get_library_user():
+    """Get the logged-in user, loading it at most once per request."""
+    if '_library_user' not in g:
+        from src.app.access_control import get_current_user
+        g._library_user = get_current_user()
+    return g._library_user
+
+
+def get_library_json():
+    """
+    Parse the JSON request body once per request, or {} if absent/invalid.
+    
+    Reads the body with cache=False so Werkzeug drops the raw bytes after
+    parsing; the parsed dict is kept on g for the view and access checks.
+    """
+    if '_library_json' not in g:
+        data = None
+        if request.is_json:
+            try:
+                data = current_app.json.loads(request.get_data(cache=False) or b'{}')
+            except ValueError:
+                data = None
+        g._library_json = data if isinstance(data, dict) else {}
+    return g._library_json
+
+
+def _library_error(message, status):
+    """Abort the current request with a JSON error body."""
+    response = jsonify({'error': message})
+    response.status_code = status
+    abort(response)
+
+
+def _require_room_access(action, from_json=False, room_id=None):
+    """
+    Resolve room_id and the current user, and verify room access.
+    
+    Call this before the view's own try/except: failures abort with the usual
+    400/401/403 JSON errors.
+    
+    Args:
+        action: Verb phrase for the denied-access log line (e.g. "search")
+        from_json: Read room_id from the JSON body instead of the query string
+        room_id: Already-resolved room ID; read from the request when None
+        
+    Returns:
+        Tuple of (user, room_id)
+    """
+    if room_id is None:
+        if from_json:
+            try:
+                room_id = int(get_library_json().get('room_id'))
+            except (ValueError, TypeError):
+                room_id = None
+        else:
+            room_id = request.args.get('room_id', type=int)
+    
+    if not room_id:
+        _library_error('room_id is required', 400)
+    
+    user = get_library_user()
+    if not user:
+        _library_error('Authentication required', 401)
+    
+    from .access_control import can_access_room_for_library
+    if not can_access_room_for_library(user.id, room_id):
+        current_app.logger.warning(
+            "User %s attempted to %s room %s without access",
+            user.id, action, room_id
+        )
+        _library_error('You do not have access to this room.', 403)
+    
+    return user, room_id
+
+
 from . import upload, search, storage, access_control
 
 __all__ = ['library']
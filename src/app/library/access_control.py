@@ -3,16 +3,29 @@ Access control helper for Library Tool.
 Wraps existing can_access_room function for Library Tool use.
 """
 
+import threading
+
+from cachetools import TTLCache
 from flask import current_app
 from typing import Optional
 
+# Recent grants keyed by (user_id, room_id). Library UIs poll stats and document
+# lists, so a short TTL turns repeat checks into memory lookups. Denials are never
+# cached, so a newly added member is let in on their next request. Membership and
+# room changes call invalidate(), which only reaches this process; the TTL bounds
+# how long another worker can keep honouring a revoked grant.
+ACCESS_CACHE_TTL_SECONDS = 5
+_ACCESS_CACHE = TTLCache(maxsize=10_000, ttl=ACCESS_CACHE_TTL_SECONDS)
+_ACCESS_CACHE_LOCK = threading.Lock()
+
 
 def can_access_room_for_library(user_id: int, room_id: int) -> bool:
     """
     Verify user has access to room for Library Tool operations.
     
-    This function wraps the existing can_access_room from src.app.access_control
+    This function applies the same rules as can_access_room from src.app.access_control
     but accepts user_id and room_id as integers (for Library Tool convenience).
+    Grants are cached per process for ACCESS_CACHE_TTL_SECONDS; denials are not.
     
     Args:
         user_id: User ID to check
@@ -21,21 +34,61 @@ def can_access_room_for_library(user_id: int, room_id: int) -> bool:
     Returns:
         True if user can access room, False otherwise
     """
+    key = (user_id, room_id)
+    with _ACCESS_CACHE_LOCK:
+        cached = _ACCESS_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
     try:
-        from src.app.access_control import can_access_room
-        from src.models.room import Room
+        from src.app import db
+        from src.app.access_control import is_admin_email
+        from src.models.room import Room, RoomMember
         from src.models.user import User
         
-        # Get user and room objects
-        user = User.query.get(user_id)
-        room = Room.query.get(room_id)
+        # One round trip instead of loading full User and Room rows: fetch just the
+        # columns can_access_room looks at, plus the membership check as EXISTS
+        row = db.session.query(
+            Room.is_active,
+            Room.owner_id,
+            db.exists().where(User.id == user_id),
+            db.session.query(User.email).filter(User.id == user_id).scalar_subquery(),
+            db.exists().where(RoomMember.room_id == room_id, RoomMember.user_id == user_id),
+        ).filter(Room.id == room_id).first()
         
-        if not user or not room:
-            return False
-        
-        # Use existing access control function
-        return can_access_room(user, room)
+        if row is None:
+            allowed = False
+        else:
+            is_active, owner_id, user_exists, email, is_member = row
+            # Same rules as can_access_room: active room, then admin, owner or member
+            allowed = bool(
+                user_exists
+                and is_active
+                and (is_admin_email(email) or owner_id == user_id or is_member)
+            )
     except Exception as e:
-        current_app.logger.error(f"Error checking room access: {e}")
+        # Lookup failures are not cached so the next request retries
+        current_app.logger.error("Error checking room access: %s", e)
         return False
+    
+    if allowed:
+        with _ACCESS_CACHE_LOCK:
+            _ACCESS_CACHE[key] = allowed
+    return allowed
 
+
+def invalidate(user_id: Optional[int], room_id: Optional[int] = None) -> None:
+    """
+    Forget cached grants after a membership or room change.
+    
+    Args:
+        user_id: User whose grants to drop, or None for every user
+        room_id: Room to drop grants for, or None for every room
+    """
+    with _ACCESS_CACHE_LOCK:
+        if user_id is not None and room_id is not None:
+            _ACCESS_CACHE.pop((user_id, room_id), None)
+            return
+        for key in list(_ACCESS_CACHE.keys()):
+            if (user_id is None or key[0] == user_id) and (room_id is None or key[1] == room_id):
+                _ACCESS_CACHE.pop(key, None)
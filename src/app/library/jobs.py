@@ -0,0 +1,244 @@
+"""
+Background job runner for Library Tool uploads.
+
+Text extraction, summarization and indexing can take seconds to minutes per
+file, so upload requests may hand them to a small in-process thread pool and
+let the client poll for the result instead of holding a request worker.
+Job state lives in the upload_status table, so a poll can be answered by any
+app worker. CPU-bound document parsing additionally runs in a small process
+pool.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from flask import current_app
+
+# Worker threads shared by all upload jobs in this process
+UPLOAD_JOB_WORKERS = int(os.getenv('LIBRARY_UPLOAD_WORKERS', '2'))
+# Finished jobs are kept this long for clients to collect their result
+UPLOAD_JOB_TTL_SECONDS = 60 * 60
+# Jobs running this long were lost with their worker (updated_at marks the start)
+UPLOAD_JOB_STALE_SECONDS = 30 * 60
+# Queued rows are not touched while they wait for a pool thread, so they only
+# count as lost (e.g. queued on a worker that restarted) after a much longer wait
+UPLOAD_JOB_QUEUED_STALE_SECONDS = 24 * 60 * 60
+# Processes per app worker for CPU-bound parsing (PDF/DOCX); 0 parses in-thread
+EXTRACT_PROCESSES = int(os.getenv('LIBRARY_EXTRACT_PROCESSES', '2'))
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=UPLOAD_JOB_WORKERS, thread_name_prefix='library-upload')
+
+# Created lazily so each forked app worker gets its own pool
+_EXTRACT_POOL = None
+_EXTRACT_POOL_PID = None
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+
+def _set_job(job_id: str, **fields) -> None:
+    """Update a job's upload_status row and commit."""
+    from src.app import db
+    from src.models.document import UploadStatus
+    
+    job = UploadStatus.query.get(job_id)
+    if job is None:
+        return
+    for name, value in fields.items():
+        setattr(job, name, value)
+    db.session.commit()
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; they were written in UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _remove_tmp_file(path) -> None:
+    if path:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def _lost_job_filter(now: datetime):
+    """SQL condition for unfinished jobs whose worker must have died."""
+    from sqlalchemy import and_, or_
+    from src.models.document import UploadStatus
+    
+    return or_(
+        and_(
+            UploadStatus.status == 'running',
+            UploadStatus.updated_at < now - timedelta(seconds=UPLOAD_JOB_STALE_SECONDS)
+        ),
+        and_(
+            UploadStatus.status == 'queued',
+            UploadStatus.created_at < now - timedelta(seconds=UPLOAD_JOB_QUEUED_STALE_SECONDS)
+        ),
+    )
+
+
+def _is_lost(job, now: datetime) -> bool:
+    """Python-side twin of _lost_job_filter for an already loaded row."""
+    if job.status == 'running':
+        return _as_utc(job.updated_at) < now - timedelta(seconds=UPLOAD_JOB_STALE_SECONDS)
+    if job.status == 'queued':
+        return _as_utc(job.created_at) < now - timedelta(seconds=UPLOAD_JOB_QUEUED_STALE_SECONDS)
+    return False
+
+
+def _start_job(job_id: str) -> bool:
+    """Mark a queued job running; False if it was already finished (e.g. failed as lost)."""
+    from src.app import db
+    from src.models.document import UploadStatus
+    
+    job = UploadStatus.query.get(job_id)
+    if job is None or job.status == 'done':
+        return False
+    job.status = 'running'
+    db.session.commit()
+    return True
+
+
+def _fail_interrupted(job) -> None:
+    """Mark a job whose worker died as failed and drop its spooled file (caller commits)."""
+    current_app.logger.warning("Upload job %s was interrupted", job.id)
+    _remove_tmp_file(job.tmp_path)
+    job.status = 'done'
+    job.http_status = 500
+    job.result = {'error': 'Upload was interrupted. Please upload the file again.'}
+    job.tmp_path = None
+
+
+def run_in_app_context(func, *args):
+    """
+    Run func(*args) on the upload pool inside the current app's context.
+    
+    Returns:
+        concurrent.futures.Future for the call
+    """
+    app = current_app._get_current_object()
+    
+    def run():
+        with app.app_context():
+            return func(*args)
+    
+    return _EXECUTOR.submit(run)
+
+
+def _get_extract_pool():
+    global _EXTRACT_POOL, _EXTRACT_POOL_PID
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None or _EXTRACT_POOL_PID != os.getpid():
+            # forkserver: never fork this multi-threaded process directly
+            _EXTRACT_POOL = ProcessPoolExecutor(
+                max_workers=EXTRACT_PROCESSES,
+                mp_context=multiprocessing.get_context('forkserver')
+            )
+            _EXTRACT_POOL_PID = os.getpid()
+        return _EXTRACT_POOL
+
+
+def run_in_process(func, *args):
+    """
+    Run a picklable module-level func(*args) in the extraction process pool.
+    
+    Keeps CPU-bound parsing from holding the GIL in the app worker. Runs
+    inline when the pool is disabled or has broken (e.g. a child was killed).
+    
+    Returns:
+        func's return value
+    """
+    global _EXTRACT_POOL
+    if EXTRACT_PROCESSES <= 0:
+        return func(*args)
+    pool = _get_extract_pool()
+    try:
+        return pool.submit(func, *args).result()
+    except BrokenProcessPool:
+        current_app.logger.warning("Extraction process pool broke; parsing in-thread")
+        with _EXTRACT_POOL_LOCK:
+            if _EXTRACT_POOL is pool:
+                _EXTRACT_POOL = None
+        return func(*args)
+
+
+def submit_upload_job(func, owner_id: int, *args, tmp_path=None) -> str:
+    """
+    Run func(*args) on the upload pool inside an app context, tracking it as a job.
+    
+    func must return a (payload dict, HTTP status) tuple. The job row is
+    committed before the work is queued, so the caller can hand out the ID.
+    
+    Args:
+        func: Work to run in the background
+        owner_id: User ID allowed to read the job state
+        *args: Positional arguments for func
+        tmp_path: Spooled upload func consumes; removed if the job is lost
+        
+    Returns:
+        Job ID for get_upload_job_state
+    """
+    from src.app import db
+    from src.models.document import UploadStatus
+    
+    # Housekeeping as new jobs arrive: drop finished jobs past their retention
+    # window and fail jobs lost with a restarted worker
+    now = datetime.now(timezone.utc)
+    UploadStatus.query.filter(
+        UploadStatus.status == 'done',
+        UploadStatus.updated_at < now - timedelta(seconds=UPLOAD_JOB_TTL_SECONDS)
+    ).delete(synchronize_session=False)
+    for job in UploadStatus.query.filter(_lost_job_filter(now)).all():
+        _fail_interrupted(job)
+    
+    job_id = str(uuid4())
+    db.session.add(UploadStatus(id=job_id, owner_id=owner_id, status='queued', tmp_path=tmp_path))
+    db.session.commit()
+    
+    def run():
+        # Never resurrect a row that was already finished; its spooled file is gone
+        if not _start_job(job_id):
+            current_app.logger.warning("Upload job %s was finished before it started; skipping", job_id)
+            return
+        try:
+            payload, status = func(*args)
+        except Exception as e:
+            current_app.logger.error("Upload job %s crashed: %s", job_id, e)
+            db.session.rollback()
+            payload, status = {'error': 'Upload failed'}, 500
+        _set_job(job_id, status='done', result=payload, http_status=status, tmp_path=None)
+    
+    run_in_app_context(run)
+    return job_id
+
+
+def get_upload_job_state(job_id: str):
+    """
+    Return a snapshot of a job's state, or None if unknown or expired.
+    
+    A job running for UPLOAD_JOB_STALE_SECONDS (or still queued after
+    UPLOAD_JOB_QUEUED_STALE_SECONDS) died with its worker; it is reported as
+    failed and its spooled file removed.
+    """
+    from src.app import db
+    from src.models.document import UploadStatus
+    
+    job = UploadStatus.query.get(job_id)
+    if job is None:
+        return None
+    
+    if _is_lost(job, datetime.now(timezone.utc)):
+        _fail_interrupted(job)
+        db.session.commit()
+    
+    return {
+        'owner_id': job.owner_id,
+        'status': job.status,
+        'http_status': job.http_status,
+        'result': job.result,
+    }
@@ -0,0 +1,49 @@
+"""
+Request schemas for Library Tool endpoints.
+Coerce and validate JSON bodies in one place; room_id is handled by
+_require_room_access.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class SearchRequest:
+    """Validated /search body."""
+    query: str
+    limit: int = 5
+    min_rank: float = 0.01
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'SearchRequest':
+        """Build from a parsed JSON body; raises ValueError with a client-facing message."""
+        query = data.get('query')
+        if query is None:
+            raise ValueError('Query is required')
+        if not isinstance(query, str) or not query.strip():
+            raise ValueError('Query cannot be empty')
+        try:
+            limit = int(data.get('limit', cls.limit))
+            min_rank = float(data.get('min_rank', cls.min_rank))
+        except (ValueError, TypeError):
+            raise ValueError('limit and min_rank must be numbers')
+        if limit < 1:
+            raise ValueError('limit must be at least 1')
+        return cls(query=query.strip(), limit=limit, min_rank=min_rank)
+
+
+@dataclass(frozen=True)
+class ClearRequest:
+    """Validated /clear body; ids=None means delete every document in the room."""
+    ids: Optional[List[str]] = None
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'ClearRequest':
+        """Build from a parsed JSON body; raises ValueError with a client-facing message."""
+        ids = data.get('ids')
+        if not ids:
+            return cls()
+        if not isinstance(ids, list):
+            raise ValueError('ids must be a list of file IDs')
+        return cls(ids=[str(file_id) for file_id in ids])
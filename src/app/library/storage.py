@@ -1,25 +1,22 @@
 """Document storage management - Railway PostgreSQL version with room scoping"""
 
-from flask import request, jsonify, current_app, session
-from functools import wraps
+from flask import request, jsonify, current_app
 import os
+import threading
 
-from . import library
-from src.utils.documents.indexer import delete_document_and_chunks, delete_all_documents, get_all_documents
-from src.utils.documents.database import get_room_storage_usage
-from src.app.access_control import get_current_user
+from cachetools import LRUCache
 
-from .access_control import can_access_room_for_library as can_access_room
+from . import library, login_required, get_library_json, _require_room_access
+from src.utils.documents.indexer import delete_documents_and_chunks_bulk, delete_all_documents, get_all_documents
+from src.utils.documents.database import get_room_documents_version, get_room_storage_usage
 
+from .schemas import ClearRequest
+
+# Serialized /documents bodies keyed by (room_id, version). Any document write
+# bumps the room's version, so stale entries are never hit and simply age out.
+_DOCUMENT_LIST_CACHE = LRUCache(maxsize=1024)
+_DOCUMENT_LIST_CACHE_LOCK = threading.Lock()
 
-def login_required(f):
-    """Session-based login required decorator."""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if 'user_id' not in session:
-            return jsonify({'error': 'Authentication required'}), 401
-        return f(*args, **kwargs)
-    return decorated_function
 
 
 @library.route('/clear', methods=['POST'])
@@ -34,48 +31,27 @@ def clear_storage():
             "room_id": 123  // Required
         }
     """
+    user, room_id = _require_room_access('delete documents in', from_json=True)
+    
+    try:
+        ids = ClearRequest.from_json(get_library_json()).ids
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
-        data = request.get_json() or {}
-        ids = data.get('ids', None)
-        room_id = data.get('room_id')
-        if room_id is not None:
-            try:
-                room_id = int(room_id)
-            except (ValueError, TypeError):
-                room_id = None
-        
-        if not room_id:
-            return jsonify({'error': 'room_id is required'}), 400
-        
-        # Get current user from session
-        user = get_current_user()
-        if not user:
-            return jsonify({'error': 'Authentication required'}), 401
-        
-        # Verify user has access to room
-        if not can_access_room(user.id, room_id):
-            current_app.logger.warning(
-                f"User {user.id} attempted to delete documents in room {room_id} without access"
-            )
-            return jsonify({
-                'error': 'You do not have access to this room.'
-            }), 403
-        
         deleted_count = 0
         
-        if ids and len(ids) > 0:
+        if ids:
             # Delete specific documents (scoped to room)
-            current_app.logger.info(f"Deleting {len(ids)} documents from room {room_id}")
-            for file_id in ids:
-                if delete_document_and_chunks(file_id, room_id=room_id):
-                    deleted_count += 1
+            current_app.logger.info("Deleting %s documents from room %s", len(ids), room_id)
+            deleted_count = delete_documents_and_chunks_bulk(ids, room_id=room_id)
         else:
             # Delete all documents in room
-            current_app.logger.info(f"Deleting all documents from room {room_id}")
+            current_app.logger.info("Deleting all documents from room %s", room_id)
             if delete_all_documents(room_id=room_id):
                 deleted_count = -1  # Indicate "all deleted"
         
-        current_app.logger.info(f"Deleted {deleted_count} documents from room {room_id}")
+        current_app.logger.info("Deleted %s documents from room %s", deleted_count, room_id)
         
         return jsonify({
             'success': True,
@@ -83,7 +59,7 @@ def clear_storage():
         }), 200
         
     except Exception as e:
-        current_app.logger.error(f"Clear storage error: {e}")
+        current_app.logger.error("Clear storage error: %s", e)
         return jsonify({'error': f'Failed to clear storage: {str(e)}'}), 500
 
 
@@ -110,36 +86,31 @@ def list_documents():
             ]
         }
     """
+    user, room_id = _require_room_access('list documents in')
+    
     try:
-        room_id = request.args.get('room_id', type=int)
-        
-        if not room_id:
-            return jsonify({'error': 'room_id query parameter is required'}), 400
-        
-        # Get current user from session
-        user = get_current_user()
-        if not user:
-            return jsonify({'error': 'Authentication required'}), 401
-        
-        # Verify user has access to room
-        if not can_access_room(user.id, room_id):
-            current_app.logger.warning(
-                f"User {user.id} attempted to list documents in room {room_id} without access"
-            )
-            return jsonify({
-                'error': 'You do not have access to this room.'
-            }), 403
-        
         try:
+            version = get_room_documents_version(room_id)
+            cache_key = (room_id, version)
+            if version is not None:
+                with _DOCUMENT_LIST_CACHE_LOCK:
+                    body = _DOCUMENT_LIST_CACHE.get(cache_key)
+                if body is not None:
+                    return current_app.response_class(body, status=200, mimetype='application/json')
+            
             documents = get_all_documents(room_id=room_id)
             
-            current_app.logger.info(f"Retrieved {len(documents)} documents for room {room_id}")
+            current_app.logger.info("Retrieved %s documents for room %s", len(documents), room_id)
             
-            return jsonify({
+            response = jsonify({
                 'documents': documents
-            }), 200
+            })
+            if version is not None:
+                with _DOCUMENT_LIST_CACHE_LOCK:
+                    _DOCUMENT_LIST_CACHE[cache_key] = response.get_data()
+            return response, 200
         except Exception as e:
-            current_app.logger.error(f"List documents error: {e}")
+            current_app.logger.error("List documents error: %s", e)
             # Return empty list if tables don't exist
             return jsonify({
                 'documents': [],
@@ -147,7 +118,7 @@ def list_documents():
             }), 200
         
     except Exception as e:
-        current_app.logger.error(f"List documents error: {e}")
+        current_app.logger.error("List documents error: %s", e)
         return jsonify({'error': f'Failed to list documents: {str(e)}'}), 500
 
 
@@ -170,28 +141,19 @@ def get_storage_stats():
             "documents_count": 5
         }
     """
+    user, room_id = _require_room_access('get storage stats for')
+    
     try:
-        room_id = request.args.get('room_id', type=int)
-        
-        if not room_id:
-            return jsonify({'error': 'room_id query parameter is required'}), 400
-        
-        # Get current user from session
-        user = get_current_user()
-        if not user:
-            return jsonify({'error': 'Authentication required'}), 401
-        
-        # Verify user has access to room
-        if not can_access_room(user.id, room_id):
-            current_app.logger.warning(
-                f"User {user.id} attempted to get storage stats for room {room_id} without access"
-            )
-            return jsonify({
-                'error': 'You do not have access to this room.'
-            }), 403
-        
         storage_stats = get_room_storage_usage(room_id)
         
+        # Stats derive only from these two counters, so they make a stable ETag
+        # and idle-room polls can be answered with an empty 304
+        etag = f"{storage_stats['total_bytes']}-{storage_stats['file_count']}"
+        if request.if_none_match.contains_weak(etag):
+            response = current_app.response_class(status=304)
+            response.set_etag(etag, weak=True)
+            return response
+        
         stats = {
             'used_bytes': storage_stats['total_bytes'],
             'limit_bytes': storage_stats['limit_bytes'],
@@ -202,13 +164,16 @@ def get_storage_stats():
         }
         
         current_app.logger.info(
-            f"Storage stats for room {room_id}: {stats['used_mb']}MB / {stats['limit_mb']}MB ({stats['percentage']}%)"
+            "Storage stats for room %s: %sMB / %sMB (%s%%)",
+            room_id, stats['used_mb'], stats['limit_mb'], stats['percentage']
         )
         
-        return jsonify(stats), 200
+        response = jsonify(stats)
+        response.set_etag(etag, weak=True)
+        return response, 200
         
     except Exception as e:
-        current_app.logger.error(f"Get storage stats error: {e}")
+        current_app.logger.error("Get storage stats error: %s", e)
         # Return empty stats if tables don't exist (graceful degradation)
         error_msg = str(e)
         if 'no such table' in error_msg.lower() or ('relation' in error_msg.lower() and 'does not exist' in error_msg.lower()):
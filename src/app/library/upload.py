@@ -1,28 +1,54 @@
 """Document upload endpoint - Railway PostgreSQL version with room scoping"""
 
-from flask import request, jsonify, current_app, session
+from flask import request, jsonify, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 from uuid import uuid4
 import os
-from functools import wraps
+import re
+import tempfile
 
-from . import library
-from src.utils.documents.extract_text import extract_text
+from . import library, login_required, get_library_user, _require_room_access
+from src.utils.documents.extract_text import extract_text_from_path
 from src.utils.documents.indexer import index_document
 from src.utils.documents.database import get_room_storage_usage
-from src.app.access_control import get_current_user
 
-from .access_control import can_access_room_for_library as can_access_room
+from .jobs import get_upload_job_state, run_in_process, submit_upload_job
 
 
-def login_required(f):
-    """Session-based login required decorator."""
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if 'user_id' not in session:
-            return jsonify({'error': 'Authentication required'}), 401
-        return f(*args, **kwargs)
-    return decorated_function
+
+# Per-room storage limit
+STORAGE_LIMIT_BYTES = 10 * 1024 * 1024  # 10 MB
+# Allowance for multipart boundaries and part headers on top of the file bytes
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+# Upper bound on files per batch upload; each one queues a job on the shared pool
+MAX_BATCH_FILES = 20
+
+# Names secure_filename would return unchanged: ASCII [A-Za-z0-9._-] only,
+# with no leading/trailing '.' or '_' for it to strip (off on Windows, where it
+# also rewrites reserved device names)
+_SAFE_NAME_RE = re.compile(r'[A-Za-z0-9-](?:[A-Za-z0-9._-]*[A-Za-z0-9-])?')
+
+
+def _safe_file_name(filename):
+    """secure_filename() with a single-match fast path for already-safe names."""
+    if filename and os.name != 'nt' and _SAFE_NAME_RE.fullmatch(filename):
+        return filename
+    return secure_filename(filename) if filename else 'unnamed_file'
+
+
+def _storage_exceeded(size_bytes, available_bytes, room_id, status):
+    """Build the "file too large for remaining room storage" error response."""
+    file_size_mb = size_bytes / (1024 * 1024)
+    available_mb = available_bytes / (1024 * 1024)
+    current_app.logger.warning(
+        "Upload rejected: file size %.2fMB exceeds available storage %.2fMB for room %s",
+        file_size_mb, available_mb, room_id
+    )
+    return jsonify({
+        'error': f'File size ({file_size_mb:.2f} MB) exceeds available storage '
+                 f'({available_mb:.2f} MB). Please delete some documents to free up space before uploading or choose a smaller document.'
+    }), status
 
 
 @library.route('/upload', methods=['POST'])
@@ -32,138 +58,104 @@ def upload_file():
     Handle file uploads, extract text, chunk, and index in Railway PostgreSQL.
     
     Room ID is extracted from query parameter (canonical source) or chat context (fallback).
+    With ?async=1 the file is indexed in the background and the response is
+    202 {"jobId", "fileId", "status"}; poll /upload/jobs/<jobId> for the result.
     """
+    # Extract room_id from query parameter (canonical source)
+    room_id = request.args.get('room_id', type=int)
+    
+    # Fallback: Try to get from chat context if available
+    if not room_id:
+        chat_id = request.args.get('chat_id', type=int)
+        if chat_id:
+            try:
+                from src.models.chat import Chat
+                chat = Chat.query.get(chat_id)
+                if chat and chat.room_id:
+                    room_id = chat.room_id
+            except Exception:
+                pass
+    
+    # Fails closed (400) if no room_id could be resolved
+    user, room_id = _require_room_access('upload to', room_id=room_id)
+    
     try:
-        # Extract room_id from query parameter (canonical source)
-        room_id = request.args.get('room_id', type=int)
-        
-        # Fallback: Try to get from chat context if available
-        if not room_id:
-            chat_id = request.args.get('chat_id', type=int)
-            if chat_id:
-                try:
-                    from src.models.chat import Chat
-                    chat = Chat.query.get(chat_id)
-                    if chat and chat.room_id:
-                        room_id = chat.room_id
-                except Exception:
-                    pass
-        
-        # Fail closed if no room_id
-        if not room_id:
-            return jsonify({
-                'error': 'room_id is required. Please provide room_id query parameter.'
-            }), 400
-        
-        # Get current user from session
-        user = get_current_user()
-        if not user:
-            return jsonify({'error': 'Authentication required'}), 401
-        
-        # Verify user has access to room
-        if not can_access_room(user.id, room_id):
-            current_app.logger.warning(
-                f"User {user.id} attempted to upload to room {room_id} without access"
-            )
-            return jsonify({
-                'error': 'You do not have access to this room.'
-            }), 403
+        # VALIDATION: Check file size against storage limit
+        # Get current storage usage for this room
+        available_bytes = None
+        try:
+            storage_stats = get_room_storage_usage(room_id)
+            available_bytes = storage_stats['remaining_bytes']
+        except Exception as e:
+            current_app.logger.error("Storage check failed: %s", e)
+            # Continue with upload if we can't check storage (graceful degradation)
+        
+        # Reject oversized uploads from the Content-Length header before the body is parsed.
+        # The header covers the whole multipart body, so allow for the form framing.
+        size_hint = request.content_length
+        if available_bytes is not None and size_hint and size_hint > available_bytes + MULTIPART_OVERHEAD_BYTES:
+            return _storage_exceeded(size_hint, available_bytes, room_id, 413)
+        
+        # Have Werkzeug stop reading bodies without a usable Content-Length past the room limit
+        request.max_content_length = STORAGE_LIMIT_BYTES + MULTIPART_OVERHEAD_BYTES
         
         # Check if file is present
-        if 'file' not in request.files:
-            return jsonify({'error': 'No file provided'}), 400
+        try:
+            if 'file' not in request.files:
+                return jsonify({'error': 'No file provided'}), 400
+        except RequestEntityTooLarge:
+            limit_bytes = available_bytes if available_bytes is not None else STORAGE_LIMIT_BYTES
+            return _storage_exceeded(request.content_length or request.max_content_length, limit_bytes, room_id, 413)
         
         file = request.files['file']
         
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        # VALIDATION: Check file size against storage limit
-        STORAGE_LIMIT_BYTES = 10 * 1024 * 1024  # 10 MB
-        
-        # Get file size
+        # Get exact file size
         file.seek(0, os.SEEK_END)
         file_size_bytes = file.tell()
         file.seek(0)  # Reset file pointer to beginning
         
-        file_size_mb = file_size_bytes / (1024 * 1024)
-        
-        # Get current storage usage for this room
-        try:
-            storage_stats = get_room_storage_usage(room_id)
-            current_usage_bytes = storage_stats['total_bytes']
-            available_bytes = storage_stats['remaining_bytes']
-            available_mb = available_bytes / (1024 * 1024)
-            
-            # Check if file would exceed storage limit
-            if file_size_bytes > available_bytes:
-                current_app.logger.warning(
-                    f"Upload rejected: file size {file_size_mb:.2f}MB exceeds "
-                    f"available storage {available_mb:.2f}MB for room {room_id}"
-                )
-                return jsonify({
-                    'error': f'File size ({file_size_mb:.2f} MB) exceeds available storage '
-                             f'({available_mb:.2f} MB). Please delete some documents to free up space before uploading or choose a smaller document.'
-                }), 400
-        except Exception as e:
-            current_app.logger.error(f"Storage check failed: {e}")
-            # Continue with upload if we can't check storage (graceful degradation)
+        # Check if file would exceed storage limit
+        if available_bytes is not None and file_size_bytes > available_bytes:
+            return _storage_exceeded(file_size_bytes, available_bytes, room_id, 400)
         
         # Generate unique file ID
         file_id = str(uuid4())
-        file_name = secure_filename(file.filename) if file.filename else 'unnamed_file'
+        file_name = _safe_file_name(file.filename)
         
-        # Extract text and generate summary
-        try:
-            extracted = extract_text(file)
-            full_text = extracted['fullText']
-            first_chunks = extracted['firstChunks']
-            summary = extracted['summary']
-        except ValueError as e:
-            current_app.logger.error(f"Text extraction error: {e}")
-            return jsonify({'error': f'Failed to process file: {str(e)}'}), 400
-        
-        # Index the document (chunk and store)
-        chunk_count = 0
-        current_app.logger.info(f"Indexing document: {file_name} (file_id: {file_id}) in room {room_id}")
+        # Spool to disk once; extraction parses from this path (and it outlives the request)
+        tmp_path = _save_upload(file)
         
-        try:
-            # Detect chunking method
-            is_pdf = file_name.lower().endswith('.pdf')
-            has_paragraphs = '\n\n' in full_text
-            text_size = len(full_text)
-            chunking_method = 'fixed' if (is_pdf or not has_paragraphs or text_size > 50000) else 'paragraph'
-            
-            current_app.logger.info(f"Using {chunking_method.upper()} chunking method")
-            
-            index_result = index_document(
-                file_id=file_id,
-                file_name=file_name,
-                full_text=full_text,
-                room_id=room_id,  # Pass room_id for scoping
-                uploaded_by=user.id,
-                chunking_method=chunking_method,
-                chunk_size=1000,
-                overlap=200,
-                file_size_bytes=file_size_bytes,
-                summary=summary
-            )
-            chunk_count = index_result['chunk_count']
-            current_app.logger.info(f"✓ Indexed {chunk_count} chunks for {file_name} in room {room_id}")
-            
-        except Exception as e:
-            current_app.logger.error(f"Indexing failed: {e}")
-            return jsonify({'error': f'Indexing failed: {str(e)}'}), 500
+        # Optionally hand extraction and indexing to the background pool
+        if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+            try:
+                job_id = submit_upload_job(
+                    _process_upload,
+                    user.id,
+                    tmp_path, file.filename, file.content_type,
+                    file_id, file_name, file_size_bytes, room_id, user.id,
+                    tmp_path=tmp_path
+                )
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            current_app.logger.info("Queued indexing job %s for %s in room %s", job_id, file_name, room_id)
+            return jsonify({
+                'jobId': job_id,
+                'fileId': file_id,
+                'status': 'queued'
+            }), 202
         
-        return jsonify({
-            'fileId': file_id,
-            'summary': summary,
-            'textPreview': first_chunks,
-            'chunkCount': chunk_count
-        }), 200
+        payload, status = _process_upload(
+            tmp_path, file.filename, file.content_type,
+            file_id, file_name, file_size_bytes, room_id, user.id
+        )
+        return jsonify(payload), status
         
     except Exception as e:
-        current_app.logger.error(f"Upload error: {e}")
+        current_app.logger.error("Upload error: %s", e)
         error_msg = str(e)
         # Check if it's a table missing error
         if 'no such table' in error_msg.lower() or ('relation' in error_msg.lower() and 'does not exist' in error_msg.lower()):
@@ -172,3 +164,185 @@ def upload_file():
             }), 500
         return jsonify({'error': f'Upload failed: {error_msg}'}), 500
 
+
+def _save_upload(file):
+    """Spool an uploaded file to a temp path; _process_upload deletes it when done."""
+    suffix = os.path.splitext(file.filename or '')[1]
+    fd, path = tempfile.mkstemp(prefix='library-upload-', suffix=suffix)
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            file.save(fh)
+    except Exception:
+        os.unlink(path)
+        raise
+    return path
+
+
+def _process_upload(tmp_path, original_filename, content_type, file_id, file_name, file_size_bytes, room_id, user_id):
+    """
+    Extract, chunk and index an uploaded file spooled by _save_upload.
+    
+    Returns:
+        Tuple of (response payload dict, HTTP status)
+    """
+    # Extract text and generate summary
+    try:
+        extracted = extract_text_from_path(tmp_path, original_filename, content_type, run=run_in_process)
+        full_text = extracted['fullText']
+        first_chunks = extracted['firstChunks']
+        summary = extracted['summary']
+    except ValueError as e:
+        current_app.logger.error("Text extraction error: %s", e)
+        return {'error': f'Failed to process file: {str(e)}'}, 400
+    finally:
+        os.unlink(tmp_path)
+    
+    # Index the document (chunk and store)
+    chunk_count = 0
+    current_app.logger.info("Indexing document: %s (file_id: %s) in room %s", file_name, file_id, room_id)
+    
+    try:
+        # Detect chunking method. The paragraph scan runs last and only on texts of at
+        # most 50k chars, since PDFs and larger texts use fixed chunking regardless.
+        is_pdf = file_name[-4:].lower() == '.pdf'
+        text_size = len(full_text)
+        chunking_method = 'fixed' if (is_pdf or text_size > 50000 or '\n\n' not in full_text) else 'paragraph'
+        
+        current_app.logger.info("Using %s chunking method", chunking_method.upper())
+        
+        index_result = index_document(
+            file_id=file_id,
+            file_name=file_name,
+            full_text=full_text,
+            room_id=room_id,  # Pass room_id for scoping
+            uploaded_by=user_id,
+            chunking_method=chunking_method,
+            chunk_size=1000,
+            overlap=200,
+            file_size_bytes=file_size_bytes,
+            summary=summary
+        )
+        chunk_count = index_result['chunk_count']
+        current_app.logger.info("✓ Indexed %s chunks for %s in room %s", chunk_count, file_name, room_id)
+        
+    except Exception as e:
+        current_app.logger.error("Indexing failed: %s", e)
+        return {'error': f'Indexing failed: {str(e)}'}, 500
+    
+    return {
+        'fileId': file_id,
+        'summary': summary,
+        'textPreview': first_chunks,
+        'chunkCount': chunk_count
+    }, 200
+
+
+@library.route('/upload_batch', methods=['POST'])
+@login_required
+def upload_batch():
+    """
+    Upload several files to a room in one request and index them in the background.
+    
+    Query parameters:
+        room_id: Required - Room ID to upload into
+    
+    Form data:
+        files: One or more files (at most MAX_BATCH_FILES)
+    
+    Returns:
+        202 {"jobs": [{"fileName", "fileId", "jobId", "status"}, ...]};
+        poll /upload/jobs/<jobId> for each file's result
+    """
+    # Access control runs once for the whole batch
+    user, room_id = _require_room_access('upload to')
+    
+    try:
+        available_bytes = None
+        try:
+            available_bytes = get_room_storage_usage(room_id)['remaining_bytes']
+        except Exception as e:
+            current_app.logger.error("Storage check failed: %s", e)
+            # Continue with upload if we can't check storage (graceful degradation)
+        
+        # As in upload_file, reject oversized batches before the body is parsed and
+        # cap how much Werkzeug will read; the whole batch must fit in the room
+        limit_bytes = available_bytes if available_bytes is not None else STORAGE_LIMIT_BYTES
+        size_hint = request.content_length
+        if size_hint and size_hint > limit_bytes + MULTIPART_OVERHEAD_BYTES:
+            return _storage_exceeded(size_hint, limit_bytes, room_id, 413)
+        request.max_content_length = limit_bytes + MULTIPART_OVERHEAD_BYTES
+        
+        try:
+            files = [f for f in request.files.getlist('files') if f.filename]
+        except RequestEntityTooLarge:
+            return _storage_exceeded(request.content_length or request.max_content_length, limit_bytes, room_id, 413)
+        if not files:
+            return jsonify({'error': 'No files provided'}), 400
+        if len(files) > MAX_BATCH_FILES:
+            return jsonify({'error': f'A batch can contain at most {MAX_BATCH_FILES} files'}), 400
+        
+        # Temp files this request still owns; each is handed to its job once
+        # queued, and whatever is left is removed on the way out
+        spooled = []
+        try:
+            # Spool each file to disk so workers never touch the request stream
+            uploads = []
+            for file in files:
+                tmp_path = _save_upload(file)
+                spooled.append(tmp_path)
+                uploads.append((
+                    tmp_path,
+                    file.filename,
+                    file.content_type,
+                    str(uuid4()),
+                    _safe_file_name(file.filename),
+                    os.path.getsize(tmp_path)
+                ))
+            
+            # Exact sizes: the batch as a whole must fit in the room's remaining storage
+            total_bytes = sum(upload[-1] for upload in uploads)
+            if available_bytes is not None and total_bytes > available_bytes:
+                return _storage_exceeded(total_bytes, available_bytes, room_id, 400)
+            
+            jobs = []
+            for upload in uploads:
+                job_id = submit_upload_job(_process_upload, user.id, *upload, room_id, user.id, tmp_path=upload[0])
+                spooled.remove(upload[0])
+                jobs.append({'fileName': upload[4], 'fileId': upload[3], 'jobId': job_id, 'status': 'queued'})
+        finally:
+            for tmp_path in spooled:
+                os.unlink(tmp_path)
+        
+        current_app.logger.info("Queued batch of %s files in room %s", len(jobs), room_id)
+        return jsonify({'jobs': jobs}), 202
+        
+    except Exception as e:
+        current_app.logger.error("Batch upload error: %s", e)
+        return jsonify({'error': f'Upload failed: {str(e)}'}), 500
+
+
+@library.route('/upload/jobs/<job_id>', methods=['GET'])
+@login_required
+def get_upload_job(job_id):
+    """
+    Poll a background upload started with /upload?async=1.
+    
+    Returns:
+        {"status": "queued" | "running" | "done", "httpStatus": 200, "result": {...}}
+        result/httpStatus are present once status is "done".
+    """
+    user = get_library_user()
+    if not user:
+        return jsonify({'error': 'Authentication required'}), 401
+    
+    job = get_upload_job_state(job_id)
+    # Jobs are only visible to the user who started them
+    if not job or job['owner_id'] != user.id:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    response = {'status': job['status']}
+    if job['status'] == 'done':
+        response['httpStatus'] = job['http_status']
+        response['result'] = job['result']
+    return jsonify(response), 200
+
@@ -0,0 +1,82 @@
+"""
+Response cache for Mind Map generation.
+
+Regenerating a mind map for unchanged inputs (UI retries, re-opening the
+tool) would otherwise repeat the whole Anthropic call. Validated results are
+cached per process, keyed by a fingerprint of everything that shapes the
+prompt: mode, size, instructions, the chat tail and the selected documents.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from cachetools import TTLCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+MINDMAP_CACHE_TTL_SECONDS = int(os.getenv('MINDMAP_CACHE_TTL_SECONDS', '3600'))
+
+# Values are serialized JSON so cached results can't be mutated by callers
+_CACHE = TTLCache(maxsize=512, ttl=MINDMAP_CACHE_TTL_SECONDS)
+_CACHE_LOCK = threading.Lock()
+
+
+def make_cache_key(
+    context_mode: str,
+    size: str,
+    instructions: Optional[str],
+    chat_fingerprint: Optional[Tuple],
+    doc_fingerprint: Iterable[Tuple]
+) -> str:
+    """
+    Build the cache key for a generation request.
+
+    Args:
+        context_mode: 'chat', 'library' or 'both'
+        size: 'small', 'medium' or 'large'
+        instructions: User instructions (None/empty for defaults)
+        chat_fingerprint: (chat_id, last message id, message count), or None
+            when chat context is not used
+        doc_fingerprint: (document id, uploaded_at) pairs for selected documents
+    """
+    payload = json.dumps(
+        [context_mode, size, instructions or '', chat_fingerprint, sorted(doc_fingerprint)],
+        default=str,
+        separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _dumps(mindmap_data: Dict):
+    """Serialize with orjson when available (bytes), else the stdlib (str)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(mindmap_data)
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits
+    return json.dumps(mindmap_data)
+
+
+def get_cached_mindmap(key: str) -> Optional[Dict]:
+    """Return a fresh copy of the cached mind map data, or None."""
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+    if cached is None:
+        return None
+    # str values came from the stdlib fallback; keep them on the stdlib path
+    if isinstance(cached, bytes):
+        return orjson.loads(cached)
+    return json.loads(cached)
+
+
+def set_cached_mindmap(key: str, mindmap_data: Dict) -> None:
+    """Cache validated mind map data under key."""
+    serialized = _dumps(mindmap_data)
+    with _CACHE_LOCK:
+        _CACHE[key] = serialized
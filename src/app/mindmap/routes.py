@@ -3,22 +3,36 @@ Mind Map Tool API Routes
 Handles mind map generation with hierarchical tree structure
 """
 
-from flask import request, jsonify, current_app, session
+from flask import Response, request, jsonify, current_app, session, stream_with_context
 from functools import wraps
-from src.app import db, limiter
+from src.app import db, limiter, user_rate_limit_key_func
 from src.app.mindmap import mindmap
 from src.models.mindmap import MindMap
 from src.models.chat import Chat, Message
-from src.models.document import Document
+from src.models.document import Document, DocumentChunk
 from src.models.room import Room
-from src.app.access_control import get_current_user, can_access_room
+from src.app.access_control import can_access_room
 from src.models.user import User
-from src.utils.openai_utils import call_anthropic_api
-from typing import Dict, List, Optional
+from src.utils.openai_utils import call_anthropic_api, stream_anthropic_api
+from src.app.mindmap.cache import get_cached_mindmap, make_cache_key, set_cached_mindmap
+from sqlalchemy import func, literal, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+import io
 import json
 
 
+# Overlaps chat and library context queries for context_mode == 'both'
+_CONTEXT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='mindmap-context')
+
+# Upper bound on selected library documents per mind map
+MAX_LIBRARY_DOCS = 50
+
+
 def login_required(f):
     """Session-based login required decorator."""
     @wraps(f)
@@ -29,25 +43,62 @@ def login_required(f):
     return decorated_function
 
 
+# Speaker prefix per message role; any non-user role reads as the assistant
+_ROLE_PREFIXES = {'user': 'User: '}
+
+
 def assemble_chat_context(chat_id: int, limit: int = 20) -> str:
     """Assemble chat messages into context string."""
     messages = (
-        Message.query
-        .filter_by(chat_id=chat_id)
+        db.session.query(Message.role, Message.content)
+        .filter(Message.chat_id == chat_id)
         .order_by(Message.timestamp.desc())
         .limit(limit)
         .all()
     )
     
-    # Reverse to chronological order
-    messages = list(reversed(messages))
+    # Iterate newest-first rows in chronological order without copying the list
+    return "\n\n".join([
+        _ROLE_PREFIXES.get(role, 'Assistant: ') + content
+        for role, content in reversed(messages)
+    ])
+
+
+def _chunk_texts_by_document(doc_ids: List[int], max_chars: int) -> Dict[int, str]:
+    """
+    Reassemble chunk text ("\n\n"-joined, in chunk order) for documents in one query.
     
-    context_parts = []
-    for msg in messages:
-        role_label = "User" if msg.role == "user" else "Assistant"
-        context_parts.append(f"{role_label}: {msg.content}")
+    Each text may be cut to max_chars + 1 characters, enough for callers to tell
+    whether it needs truncating.
+    """
+    if not doc_ids:
+        return {}
+    
+    if db.session.get_bind().dialect.name == 'postgresql':
+        rows = db.session.query(
+            DocumentChunk.document_id,
+            func.substr(
+                func.string_agg(
+                    DocumentChunk.chunk_text,
+                    aggregate_order_by(literal("\n\n"), DocumentChunk.chunk_index)
+                ),
+                1, max_chars + 1
+            )
+        ).filter(
+            DocumentChunk.document_id.in_(doc_ids)
+        ).group_by(DocumentChunk.document_id).all()
+        return {doc_id: text or "" for doc_id, text in rows}
     
-    return "\n\n".join(context_parts)
+    # Other databases: one ordered query, joined per document here
+    rows = db.session.query(
+        DocumentChunk.document_id, DocumentChunk.chunk_text
+    ).filter(
+        DocumentChunk.document_id.in_(doc_ids)
+    ).order_by(DocumentChunk.document_id, DocumentChunk.chunk_index).all()
+    return {
+        doc_id: "\n\n".join(text for _, text in group)
+        for doc_id, group in groupby(rows, key=itemgetter(0))
+    }
 
 
 def assemble_library_context(doc_ids: List[int], max_chars: int = 10000) -> str:
@@ -55,35 +106,65 @@ def assemble_library_context(doc_ids: List[int], max_chars: int = 10000) -> str:
     if not doc_ids:
         return ""
     
-    documents = Document.query.filter(Document.id.in_(doc_ids)).all()
+    # Only the first max_chars + 1 characters of each document ever matter, so
+    # large documents are cut in the database instead of loaded whole
+    documents = db.session.query(
+        Document.id,
+        Document.name,
+        func.substr(Document.full_text, 1, max_chars + 1)
+    ).filter(Document.id.in_(doc_ids)).order_by(Document.id).all()
     
-    context_parts = []
-    total_chars = 0
+    # Documents without full_text are rebuilt from chunks; fetch those in one
+    # query, and only for documents the character budget can still reach
+    needs_chunks = []
+    budget = max_chars
+    for doc_id, _, text_head in documents:
+        if budget <= 0:
+            break
+        if text_head:
+            budget -= len(text_head)
+        else:
+            needs_chunks.append(doc_id)
+    chunk_texts = _chunk_texts_by_document(needs_chunks, max_chars)
     
-    for doc in documents:
-        # Get document text (from full_text or chunks)
-        doc_text = doc.full_text or ""
-        
-        if not doc_text and doc.chunks:
-            # Reconstruct from chunks
-            chunks = sorted(doc.chunks, key=lambda c: c.chunk_index)
-            doc_text = "\n\n".join([c.chunk_text for c in chunks])
-        
-        # Truncate if needed
-        remaining_chars = max_chars - total_chars
-        if remaining_chars <= 0:
+    buf = io.StringIO()
+    budget = max_chars
+    
+    for doc_id, name, text_head in documents:
+        if budget <= 0:
             break
         
-        if len(doc_text) > remaining_chars:
-            doc_text = doc_text[:remaining_chars] + "... [truncated]"
+        # Get document text (from full_text or chunks), truncated to the budget
+        piece = (text_head or chunk_texts.get(doc_id, ""))[:budget + 1]
         
-        context_parts.append(f"Document: {doc.name}\n{doc_text}")
-        total_chars += len(doc_text)
-        
-        if total_chars >= max_chars:
-            break
+        if buf.tell():
+            buf.write("\n\n---\n\n")
+        buf.write("Document: ")
+        buf.write(name)
+        buf.write("\n")
+        if len(piece) > budget:
+            buf.write(piece[:budget])
+            buf.write("... [truncated]")
+            budget = 0
+        else:
+            buf.write(piece)
+            budget -= len(piece)
     
-    return "\n\n---\n\n".join(context_parts)
+    return buf.getvalue()
+
+
+def _run_with_app_context(func, *args) -> Future:
+    """Run func(*args) on the context pool inside a fresh app context (and DB session)."""
+    app = current_app._get_current_object()
+    
+    def run():
+        with app.app_context():
+            try:
+                return func(*args)
+            finally:
+                db.session.remove()
+    
+    return _CONTEXT_EXECUTOR.submit(run)
 
 
 def assemble_mindmap_context(context_mode: str, chat_id: Optional[int] = None, library_doc_ids: Optional[List[int]] = None) -> Dict[str, Optional[str]]:
@@ -103,67 +184,30 @@ def assemble_mindmap_context(context_mode: str, chat_id: Optional[int] = None, l
         else:
             context_parts['library'] = None
     elif context_mode == 'both':
-        if chat_id:
+        if chat_id and library_doc_ids:
+            # Independent queries: run the library side on a worker thread
+            library_future = _run_with_app_context(assemble_library_context, library_doc_ids)
             context_parts['chat'] = assemble_chat_context(chat_id)
+            context_parts['library'] = library_future.result()
         else:
-            context_parts['chat'] = None
-        if library_doc_ids:
-            context_parts['library'] = assemble_library_context(library_doc_ids)
-        else:
-            context_parts['library'] = None
+            context_parts['chat'] = assemble_chat_context(chat_id) if chat_id else None
+            context_parts['library'] = assemble_library_context(library_doc_ids) if library_doc_ids else None
     
     return context_parts
 
 
-def get_node_count_for_size(size: str) -> int:
-    """Get target node count based on size."""
-    if size == 'small':
-        return 6  # 1 root + 5 branches (target 5-8 total)
-    elif size == 'medium':
-        return 12  # 1 root + 11 branches (target 10-15 total)
-    elif size == 'large':
-        return 25  # 1 root + 24 branches (target 20-30 total)
-    else:
-        return 12  # default to medium
-
-
-def generate_mindmap_prompt(context_parts: Dict[str, Optional[str]], context_mode: str, node_count: int, instructions: Optional[str] = None) -> str:
-    """Generate the prompt for mind map generation."""
-    
-    # Build context section based on mode
-    context_section = ""
-    context_instruction = ""
-    
-    if context_mode == 'chat':
-        context_instruction = "You MUST use ONLY the chat conversation context provided below. Do NOT use library documents or outside knowledge."
-        if context_parts.get('chat'):
-            context_section = f"=== CHAT CONVERSATION ===\n{context_parts['chat']}"
-        else:
-            context_section = "No chat context available."
-    elif context_mode == 'library':
-        context_instruction = "You MUST use ONLY the library documents context provided below. Do NOT use chat conversation or outside knowledge."
-        if context_parts.get('library'):
-            context_section = f"=== LIBRARY DOCUMENTS ===\n{context_parts['library']}"
-        else:
-            context_section = "No library context available."
-    elif context_mode == 'both':
-        context_instruction = "You MUST use ONLY the chat conversation and library documents provided below. If there is a conflict, prefer chat for user intent and library for factual detail. Do NOT use outside knowledge."
-        context_sections = []
-        if context_parts.get('chat'):
-            context_sections.append(f"=== CHAT CONVERSATION ===\n{context_parts['chat']}")
-        if context_parts.get('library'):
-            context_sections.append(f"=== LIBRARY DOCUMENTS ===\n{context_parts['library']}")
-        context_section = "\n\n".join(context_sections) if context_sections else "No context available."
-    
-    base_prompt = f"""You are creating a hierarchical mind map visualization.
-
-STRICT CONTEXT BOUNDARY:
-{context_instruction}
+# Target node count per mind map size; keys are also the valid sizes
+_NODE_COUNTS = {
+    'small': 6,    # 1 root + 5 branches (target 5-8 total)
+    'medium': 12,  # 1 root + 11 branches (target 10-15 total)
+    'large': 25,   # 1 root + 24 branches (target 20-30 total)
+}
 
-{context_section}
 
-TASK:
-Generate a hierarchical mind map with approximately {node_count} total nodes based on the context material above.
+# Static instructions shared by every request. Sent first as part of the cached
+# prompt prefix, so it must stay byte-identical across calls (no per-request
+# values such as node_count belong here).
+MINDMAP_STATIC_PROMPT = """You are creating a hierarchical mind map visualization.
 
 MIND MAP STRUCTURE:
 - The mind map should have a ROOT node (central topic) that represents the main subject
@@ -180,68 +224,258 @@ NODE REQUIREMENTS:
 - Explanations should be informative, drawing from the provided context
 - Do not invent information not present in the context
 
-ADDITIONAL INSTRUCTIONS:
-{instructions if instructions else "Focus on key concepts and important relationships from the context. Organize hierarchically with the most important concept as the root."}
-
 OUTPUT FORMAT (JSON):
-{{
-  "root": {{
+{
+  "root": {
     "id": "root",
     "label": "Main Topic Name",
     "explanation": "Brief explanation of the main topic (1 paragraph max)..."
-  }},
+  },
   "nodes": [
-    {{
+    {
       "id": "node1",
       "label": "Primary Branch 1",
       "explanation": "Brief explanation of this branch (1 paragraph max)...",
       "parent": "root",
       "children": [
-        {{
+        {
           "id": "node1-1",
           "label": "Sub-branch 1",
           "explanation": "Brief explanation (1 paragraph max)...",
           "parent": "node1"
-        }},
-        {{
+        },
+        {
           "id": "node1-2",
           "label": "Sub-branch 2",
           "explanation": "Brief explanation (1 paragraph max)...",
           "parent": "node1"
-        }}
+        }
       ]
-    }},
-    {{
+    },
+    {
       "id": "node2",
       "label": "Primary Branch 2",
       "explanation": "Brief explanation (1 paragraph max)...",
       "parent": "root",
       "children": []
-    }}
+    }
   ]
-}}
+}
 
 IMPORTANT:
 - The root node has no parent
 - All other nodes must have a parent ID
 - Children arrays can be empty for leaf nodes
-- Ensure the total node count (1 root + all nodes) is approximately {node_count}
-- Each explanation must be 1 paragraph maximum
+- Each explanation must be 1 paragraph maximum"""
+
+# Required keys of the root and of each node in the AI's JSON response
+_ROOT_NODE_FIELDS = frozenset(('id', 'label', 'explanation'))
+_NODE_FIELDS = _ROOT_NODE_FIELDS | {'parent'}
+
+DEFAULT_MINDMAP_INSTRUCTIONS = "Focus on key concepts and important relationships from the context. Organize hierarchically with the most important concept as the root."
+
+# Per-mode boundary preamble and the message used when a mode has no context
+_CONTEXT_BOUNDARY_PREFIXES = {
+    'chat': "STRICT CONTEXT BOUNDARY:\nYou MUST use ONLY the chat conversation context provided below. Do NOT use library documents or outside knowledge.\n\n",
+    'library': "STRICT CONTEXT BOUNDARY:\nYou MUST use ONLY the library documents context provided below. Do NOT use chat conversation or outside knowledge.\n\n",
+    'both': "STRICT CONTEXT BOUNDARY:\nYou MUST use ONLY the chat conversation and library documents provided below. If there is a conflict, prefer chat for user intent and library for factual detail. Do NOT use outside knowledge.\n\n",
+}
+_NO_CONTEXT_MESSAGES = {
+    'chat': "No chat context available.",
+    'library': "No library context available.",
+    'both': "No context available.",
+}
+_CHAT_SECTION_HEADER = "=== CHAT CONVERSATION ===\n"
+_LIBRARY_SECTION_HEADER = "=== LIBRARY DOCUMENTS ===\n"
+
+# Task block pieces around the per-request node count and instructions
+_TASK_PREFIX = "TASK:\nGenerate a hierarchical mind map with approximately "
+_TASK_COUNT_MIDDLE = " total nodes based on the context material above.\nEnsure the total node count (1 root + all nodes) is approximately "
+_TASK_INSTRUCTIONS_HEADER = ".\n\nADDITIONAL INSTRUCTIONS:\n"
+_TASK_SUFFIX = "\n\nReturn ONLY valid JSON, no additional text before or after."
+
+
+def _context_block_text(context_parts: Dict[str, Optional[str]], context_mode: str) -> str:
+    """Build the context-boundary section for the given mode."""
+    parts = [_CONTEXT_BOUNDARY_PREFIXES.get(context_mode, "STRICT CONTEXT BOUNDARY:\n\n\n")]
+    chat = context_parts.get('chat') if context_mode in ('chat', 'both') else None
+    library = context_parts.get('library') if context_mode in ('library', 'both') else None
+    
+    if chat:
+        parts += (_CHAT_SECTION_HEADER, chat)
+    if library:
+        if chat:
+            parts.append("\n\n")
+        parts += (_LIBRARY_SECTION_HEADER, library)
+    if not chat and not library:
+        parts.append(_NO_CONTEXT_MESSAGES.get(context_mode, ""))
+    
+    return "".join(parts)
+
+
+def generate_mindmap_prompt(context_parts: Dict[str, Optional[str]], context_mode: str, node_count: int, instructions: Optional[str] = None) -> List[Dict]:
+    """
+    Generate the prompt for mind map generation as Anthropic content blocks.
+    
+    Ordered from most to least stable: the static instructions, then the
+    context, then the per-request task. One cache breakpoint after the context
+    lets regenerating with another size or instructions reuse static text plus
+    context. The static text alone (~500 tokens) is below Anthropic's minimum
+    cacheable prefix (1024 tokens on Sonnet, 2048 on Haiku), so it gets no
+    breakpoint of its own; short contexts may not be cached at all.
+    """
+    count = str(node_count)
+    task = "".join((
+        _TASK_PREFIX, count, _TASK_COUNT_MIDDLE, count, _TASK_INSTRUCTIONS_HEADER,
+        instructions if instructions else DEFAULT_MINDMAP_INSTRUCTIONS, _TASK_SUFFIX
+    ))
+    
+    return [
+        {"type": "text", "text": MINDMAP_STATIC_PROMPT},
+        {"type": "text", "text": _context_block_text(context_parts, context_mode), "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": task},
+    ]
 
-Return ONLY valid JSON, no additional text before or after."""
 
-    return base_prompt
+MINDMAP_SYSTEM_PROMPT = "You are an expert at creating hierarchical mind maps. Follow all instructions strictly and return only valid JSON."
+MINDMAP_MAX_TOKENS = 4000
+
+
+def parse_mindmap_response(text_content: str) -> Dict:
+    """
+    Extract and validate mind map data from the AI's response text.
+    
+    Raises:
+        json.JSONDecodeError: If the response JSON can't be parsed
+        ValueError: If the response is empty or missing required fields
+    """
+    if not text_content or not text_content.strip():
+        raise ValueError("Empty response from AI")
+    
+    # Extract JSON from response
+    json_start = text_content.find('{')
+    json_end = text_content.rfind('}') + 1
+    if json_start == -1 or json_end == 0:
+        raise ValueError("No JSON found in response")
+    
+    # App JSON provider: orjson when installed (its decode error subclasses
+    # json.JSONDecodeError, so callers' handling is unchanged)
+    mindmap_data = current_app.json.loads(text_content[json_start:json_end])
+    if not isinstance(mindmap_data, dict):
+        raise ValueError("Mind map response is not a JSON object")
+    
+    # Validate structure
+    if 'root' not in mindmap_data:
+        raise ValueError("Missing 'root' in response")
+    
+    nodes = mindmap_data.setdefault('nodes', [])
+    
+    root = mindmap_data['root']
+    if not isinstance(root, dict) or not _ROOT_NODE_FIELDS <= root.keys():
+        raise ValueError("Root node missing required fields (id, label, explanation)")
+    
+    # Validate nodes: one C-level subset test per node instead of per-key probes
+    for node in nodes:
+        if not isinstance(node, dict) or not _NODE_FIELDS <= node.keys():
+            node_id = node.get('id', 'unknown') if isinstance(node, dict) else 'unknown'
+            raise ValueError(f"Node missing required fields: {node_id}")
+        node.setdefault('children', [])
+    
+    return mindmap_data
+
+
+def generate_mindmap_data(context_parts: Dict[str, Optional[str]], context_mode: str, node_count: int, instructions: Optional[str] = None) -> Dict:
+    """
+    Call the AI and return validated mind map data.
+    
+    Raises:
+        json.JSONDecodeError: If the response JSON can't be parsed
+        ValueError: If the response is empty or missing required fields
+    """
+    # Generate prompt (content blocks with cache breakpoints)
+    prompt_blocks = generate_mindmap_prompt(context_parts, context_mode, node_count, instructions)
+    
+    # Call AI
+    text_content, is_truncated = call_anthropic_api(
+        messages=[{"role": "user", "content": prompt_blocks}],
+        system_prompt=MINDMAP_SYSTEM_PROMPT,
+        max_tokens=MINDMAP_MAX_TOKENS
+    )
+    
+    return parse_mindmap_response(text_content)
+
+
+def store_mindmap(mindmap_data: Dict, **fields) -> Dict:
+    """Insert and commit a MindMap row; returns its to_dict()."""
+    mindmap_obj = MindMap(mind_map_data=mindmap_data, **fields)
+    db.session.add(mindmap_obj)
+    db.session.flush()
+    # Serialize before commit expires the attributes (avoids a reload SELECT).
+    # to_dict() hands back mindmap_data by reference, so the node tree is never
+    # copied or walked here; it is encoded exactly once, by the response.
+    mindmap_dict = mindmap_obj.to_dict()
+    if db.session.get_bind().dialect.name == 'postgresql':
+        # Regenerable row: don't wait on the WAL flush. The commit stays
+        # atomic; a server crash can at worst lose this mind map.
+        db.session.execute(text("SET LOCAL synchronous_commit = OFF"))
+    db.session.commit()
+    return mindmap_dict
+
+
+def _sse_event(event: str, payload: Dict) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {current_app.json.dumps(payload)}\n\n"
+
+
+def stream_mindmap(context_parts: Dict[str, Optional[str]], context_mode: str, node_count: int,
+                   instructions: Optional[str], cache_key: str, mindmap_fields: Dict) -> Iterator[str]:
+    """
+    Generate, cache and store a mind map as server-sent events.
+    
+    Emits 'progress' ({chars}) as the AI response arrives, then either
+    'done' with the same body the JSON endpoint returns, or 'error'.
+    """
+    prompt_blocks = generate_mindmap_prompt(context_parts, context_mode, node_count, instructions)
+    chunks = []
+    received = 0
+    try:
+        for delta in stream_anthropic_api(
+            messages=[{"role": "user", "content": prompt_blocks}],
+            system_prompt=MINDMAP_SYSTEM_PROMPT,
+            max_tokens=MINDMAP_MAX_TOKENS
+        ):
+            chunks.append(delta)
+            received += len(delta)
+            yield _sse_event('progress', {'chars': received})
+        mindmap_data = parse_mindmap_response(''.join(chunks))
+    except json.JSONDecodeError as e:
+        current_app.logger.error(f"JSON decode error: {e}")
+        yield _sse_event('error', {'error': 'Failed to parse mind map response from AI'})
+        return
+    except Exception as e:
+        current_app.logger.error(f"AI generation error: {e}")
+        yield _sse_event('error', {'error': f'Failed to generate mind map: {str(e)}'})
+        return
+    
+    set_cached_mindmap(cache_key, mindmap_data)
+    try:
+        mindmap_dict = store_mindmap(mindmap_data, **mindmap_fields)
+    except Exception as e:
+        current_app.logger.error(f"Mind map generation error: {e}")
+        db.session.rollback()
+        yield _sse_event('error', {'error': f'Failed to generate mind map: {str(e)}'})
+        return
+    
+    yield _sse_event('done', {'success': True, 'mind_map': mindmap_dict})
 
 
 @mindmap.route('/generate', methods=['POST'])
 @login_required
-@limiter.limit("10 per minute; 50 per hour")
+@limiter.limit("10 per minute; 50 per hour", key_func=user_rate_limit_key_func)
 def generate_mindmap():
     """Generate a mind map based on chat and/or library context."""
     try:
-        user = get_current_user()
-        if not user:
-            return jsonify({'error': 'Authentication required'}), 401
+        user_id = session['user_id']
         
         data = request.get_json() or {}
         
@@ -249,24 +483,43 @@ def generate_mindmap():
         chat_id = data.get('chat_id')
         context_mode = data.get('context_mode', 'chat')
         size = data.get('size', 'medium')
-        library_doc_ids = data.get('library_doc_ids', [])
+        library_doc_ids = data.get('library_doc_ids') or []
         instructions = data.get('instructions', '').strip()
         
         if not chat_id:
             return jsonify({'error': 'chat_id is required'}), 400
         
+        if not isinstance(library_doc_ids, list) or len(library_doc_ids) > MAX_LIBRARY_DOCS:
+            return jsonify({'error': f'library_doc_ids must be a list of at most {MAX_LIBRARY_DOCS} ids'}), 400
+        try:
+            # Canonical order (sorted, no duplicates): the same selection in any UI
+            # order yields the same prompt, cache entry and stored ids
+            library_doc_ids = sorted({int(doc_id) for doc_id in library_doc_ids})
+        except (TypeError, ValueError):
+            return jsonify({'error': 'library_doc_ids must contain integer ids'}), 400
+        
         if context_mode not in ('chat', 'library', 'both'):
             return jsonify({'error': 'context_mode must be "chat", "library", or "both"'}), 400
         
-        if size not in ('small', 'medium', 'large'):
+        # Size lookup doubles as validation (non-strings would not hash)
+        node_count = _NODE_COUNTS.get(size) if isinstance(size, str) else None
+        if node_count is None:
             return jsonify({'error': 'size must be "small", "medium", or "large"'}), 400
         
-        # Check chat access
-        chat_obj = Chat.query.get(chat_id)
-        if not chat_obj:
+        # Check chat access; chat, room and the session user load in one
+        # round-trip (outer joins so each missing row keeps its own error)
+        row = db.session.query(Chat, Room, User).outerjoin(
+            Room, Room.id == Chat.room_id
+        ).outerjoin(
+            User, User.id == user_id
+        ).filter(Chat.id == chat_id).first()
+        if not row:
             return jsonify({'error': 'Chat not found'}), 404
         
-        room_obj = Room.query.get(chat_obj.room_id)
+        chat_obj, room_obj, user = row
+        if not user:
+            return jsonify({'error': 'Authentication required'}), 401
+        
         if not room_obj:
             return jsonify({'error': 'Room not found'}), 404
         
@@ -274,108 +527,103 @@ def generate_mindmap():
             return jsonify({'error': 'Access denied'}), 403
         
         # Validate library access if needed
+        doc_fingerprint = []
         if context_mode in ('library', 'both'):
             if not library_doc_ids:
                 if context_mode == 'library':
                     return jsonify({'error': 'At least one library document is required when context_mode is "library"'}), 400
             else:
-                docs = Document.query.filter(
+                # Two narrow columns (never full Document rows); they also key the cache
+                doc_fingerprint = Document.query.with_entities(Document.id, Document.uploaded_at).filter(
                     Document.id.in_(library_doc_ids),
                     Document.room_id == chat_obj.room_id
                 ).all()
-                if len(docs) != len(library_doc_ids):
+                if len(doc_fingerprint) != len(library_doc_ids):
                     return jsonify({'error': 'One or more documents not found or access denied'}), 403
         
-        # Assemble context with strict boundaries
-        context_parts = assemble_mindmap_context(context_mode, chat_id, library_doc_ids)
-        
-        # Check if context is available
-        has_context = False
-        if context_mode == 'chat' and context_parts.get('chat'):
-            has_context = True
-        elif context_mode == 'library' and context_parts.get('library'):
-            has_context = True
-        elif context_mode == 'both' and (context_parts.get('chat') or context_parts.get('library')):
-            has_context = True
+        # Identical inputs (same chat tail, documents and options) reuse a cached result
+        chat_fingerprint = None
+        if context_mode in ('chat', 'both'):
+            last_message_id, message_count = db.session.query(
+                func.max(Message.id), func.count(Message.id)
+            ).filter(Message.chat_id == chat_id).one()
+            chat_fingerprint = (chat_id, last_message_id, message_count)
+        cache_key = make_cache_key(
+            context_mode, size, instructions, chat_fingerprint,
+            [tuple(row) for row in doc_fingerprint]
+        )
         
-        if not has_context:
-            return jsonify({
-                'error': 'No context available. Please ensure chat has messages or library documents are selected.'
-            }), 400
+        mindmap_fields = dict(
+            chat_id=chat_id,
+            room_id=chat_obj.room_id,
+            created_by=user_id,
+            context_mode=context_mode,
+            library_doc_ids=library_doc_ids if library_doc_ids else None,
+            instructions=instructions if instructions else None,
+            size=size
+        )
         
-        # Get target node count
-        node_count = get_node_count_for_size(size)
+        # Opt-in streaming: clients asking for SSE get progress while the AI responds
+        wants_stream = request.accept_mimetypes.best_match(
+            ['application/json', 'text/event-stream']
+        ) == 'text/event-stream'
+        sse_headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
         
-        # Generate mind map
-        current_app.logger.info(f"Generating mind map for chat {chat_id}, size: {size}, nodes: {node_count}")
-        
-        try:
-            # Generate prompt
-            prompt = generate_mindmap_prompt(context_parts, context_mode, node_count, instructions)
-            
-            # Call AI
-            text_content, is_truncated = call_anthropic_api(
-                messages=[{"role": "user", "content": prompt}],
-                system_prompt="You are an expert at creating hierarchical mind maps. Follow all instructions strictly and return only valid JSON.",
-                max_tokens=4000
-            )
-            
-            if not text_content or not text_content.strip():
-                raise ValueError("Empty response from AI")
-            
-            # Extract JSON from response
-            json_start = text_content.find('{')
-            json_end = text_content.rfind('}') + 1
-            if json_start == -1 or json_end == 0:
-                raise ValueError("No JSON found in response")
-            
-            json_text = text_content[json_start:json_end]
-            mindmap_data = json.loads(json_text)
-            
-            # Validate structure
-            if 'root' not in mindmap_data:
-                raise ValueError("Missing 'root' in response")
+        mindmap_data = get_cached_mindmap(cache_key)
+        if mindmap_data is not None:
+            current_app.logger.info(f"Mind map cache hit for chat {chat_id}, size: {size}")
+        else:
+            # Assemble context with strict boundaries
+            context_parts = assemble_mindmap_context(context_mode, chat_id, library_doc_ids)
             
-            if 'nodes' not in mindmap_data:
-                mindmap_data['nodes'] = []
+            # Check if context is available
+            has_context = False
+            if context_mode == 'chat' and context_parts.get('chat'):
+                has_context = True
+            elif context_mode == 'library' and context_parts.get('library'):
+                has_context = True
+            elif context_mode == 'both' and (context_parts.get('chat') or context_parts.get('library')):
+                has_context = True
             
-            root = mindmap_data['root']
-            if 'id' not in root or 'label' not in root or 'explanation' not in root:
-                raise ValueError("Root node missing required fields (id, label, explanation)")
+            if not has_context:
+                return jsonify({
+                    'error': 'No context available. Please ensure chat has messages or library documents are selected.'
+                }), 400
             
-            # Validate nodes
-            for node in mindmap_data['nodes']:
-                if 'id' not in node or 'label' not in node or 'explanation' not in node or 'parent' not in node:
-                    raise ValueError(f"Node missing required fields: {node.get('id', 'unknown')}")
-                if 'children' not in node:
-                    node['children'] = []
+            # Generate mind map
+            current_app.logger.info(f"Generating mind map for chat {chat_id}, size: {size}, nodes: {node_count}")
             
-            # Store mind map
-            mindmap_obj = MindMap(
-                chat_id=chat_id,
-                room_id=chat_obj.room_id,
-                created_by=user.id,
-                context_mode=context_mode,
-                library_doc_ids=library_doc_ids if library_doc_ids else None,
-                instructions=instructions if instructions else None,
-                size=size,
-                mind_map_data=mindmap_data
-            )
-            db.session.add(mindmap_obj)
-            db.session.commit()
+            if wants_stream:
+                return Response(
+                    stream_with_context(stream_mindmap(
+                        context_parts, context_mode, node_count, instructions, cache_key, mindmap_fields
+                    )),
+                    mimetype='text/event-stream',
+                    headers=sse_headers
+                )
             
-            # Return mind map data
-            return jsonify({
-                'success': True,
-                'mind_map': mindmap_obj.to_dict()
-            }), 200
+            try:
+                mindmap_data = generate_mindmap_data(context_parts, context_mode, node_count, instructions)
+            except json.JSONDecodeError as e:
+                current_app.logger.error(f"JSON decode error: {e}")
+                return jsonify({'error': 'Failed to parse mind map response from AI'}), 500
+            except Exception as e:
+                current_app.logger.error(f"AI generation error: {e}")
+                return jsonify({'error': f'Failed to generate mind map: {str(e)}'}), 500
             
-        except json.JSONDecodeError as e:
-            current_app.logger.error(f"JSON decode error: {e}")
-            return jsonify({'error': 'Failed to parse mind map response from AI'}), 500
-        except Exception as e:
-            current_app.logger.error(f"AI generation error: {e}")
-            return jsonify({'error': f'Failed to generate mind map: {str(e)}'}), 500
+            set_cached_mindmap(cache_key, mindmap_data)
+        
+        # Store mind map
+        mindmap_dict = store_mindmap(mindmap_data, **mindmap_fields)
+        
+        # Return mind map data; a streaming client gets a cache hit as a single 'done' event
+        body = {
+            'success': True,
+            'mind_map': mindmap_dict
+        }
+        if wants_stream:
+            return Response(_sse_event('done', body), mimetype='text/event-stream', headers=sse_headers)
+        return jsonify(body), 200
         
     except Exception as e:
         current_app.logger.error(f"Mind map generation error: {e}")
@@ -79,6 +79,8 @@ def invite_members(room_id: int) -> Any:
                 
                 db.session.add(member)
                 db.session.commit()
+                from src.app.library.access_control import invalidate as invalidate_library_access
+                invalidate_library_access(invitee.id, room_id)
                 
                 who = invitee.email if invitee_email else f"@{invitee.username}"
                 # Send email if an email was provided
@@ -151,7 +153,7 @@ def accept_invitation(invitation_id: int) -> Any:
 
 @invitations_bp.route("/decline/<int:invitation_id>", methods=["POST"])
 @require_login
-def decline_invitation(invitation_id: int) -> Any:
+def decline_invitation(room_id: int, invitation_id: int) -> Any:
     """Decline a room invitation."""
     try:
         user = get_current_user()
@@ -170,6 +172,8 @@ def decline_invitation(invitation_id: int) -> Any:
         # Remove the invitation
         db.session.delete(invitation)
         db.session.commit()
+        from src.app.library.access_control import invalidate as invalidate_library_access
+        invalidate_library_access(invitation.user_id, invitation.room_id)
         
         flash("Invitation declined.", "info")
         return redirect(url_for('room.room_crud.index'))
@@ -244,7 +248,7 @@ def manage_invitations(room_id: int) -> Any:
 
 @invitations_bp.route("/revoke/<int:invitation_id>", methods=["POST"])
 @require_login
-def revoke_invitation(invitation_id: int) -> Any:
+def revoke_invitation(room_id: int, invitation_id: int) -> Any:
     """Revoke a pending invitation."""
     try:
         user = get_current_user()
@@ -270,6 +274,8 @@ def revoke_invitation(invitation_id: int) -> Any:
         # Remove the invitation
         db.session.delete(invitation)
         db.session.commit()
+        from src.app.library.access_control import invalidate as invalidate_library_access
+        invalidate_library_access(invitation.user_id, invitation.room_id)
         
         flash("Invitation revoked successfully.", "success")
         return redirect(url_for('room.room_invitations.manage_invitations', room_id=invitation.room_id))
@@ -320,7 +326,7 @@ def update_member_permissions(member_id: int) -> Any:
 
 @invitations_bp.route("/remove/<int:member_id>", methods=["POST"])
 @require_login
-def remove_member(member_id: int) -> Any:
+def remove_member(room_id: int, member_id: int) -> Any:
     """Remove a member from the room."""
     try:
         user = get_current_user()
@@ -351,6 +357,8 @@ def remove_member(member_id: int) -> Any:
         # Remove the member
         db.session.delete(member)
         db.session.commit()
+        from src.app.library.access_control import invalidate as invalidate_library_access
+        invalidate_library_access(member.user_id, member.room_id)
         
         flash("Member removed from room successfully.", "success")
         return redirect(url_for('room.room_invitations.manage_invitations', room_id=member.room_id))
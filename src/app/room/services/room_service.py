@@ -236,6 +236,9 @@ class RoomService:
                 room.is_active = data.is_active
             
             db.session.commit()
+            if data.is_active is not None:
+                from src.app.library.access_control import invalidate as invalidate_library_access
+                invalidate_library_access(None, room.id)
             
             current_app.logger.info(f"Room {room_id} updated by user {user.id}")
             
@@ -269,6 +272,8 @@ class RoomService:
             # Soft delete
             room.is_active = False
             db.session.commit()
+            from src.app.library.access_control import invalidate as invalidate_library_access
+            invalidate_library_access(None, room.id)
             
             current_app.logger.info(f"Room {room_id} deleted (soft) by user {user.id}")
             
@@ -24,7 +24,7 @@ from .card_comment import CardComment, generate_card_key, generate_body_hash
 from .quiz import Quiz, QuizAnswer
 from .flashcards import FlashcardSet, FlashcardSession
 from .mindmap import MindMap
-from .document import Document, DocumentChunk
+from .document import Document, DocumentChunk, UploadStatus
 
 __all__ = [
     "User",
@@ -58,4 +58,5 @@ __all__ = [
     "MindMap",
     "Document",
     "DocumentChunk",
+    "UploadStatus",
 ]
@@ -59,7 +59,11 @@ class Message(db.Model):
     """A single turn in the conversation (user or assistant)."""
     
     __tablename__ = 'message'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Latest-N-messages-per-chat lookups (scanned backwards for DESC)
+        db.Index('ix_message_chat_timestamp', 'chat_id', 'timestamp'),
+        {'extend_existing': True}
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     chat_id = db.Column(
@@ -10,7 +10,7 @@ Document storage models for Railway PostgreSQL using SQLAlchemy ORM
 """
 
 from datetime import datetime, timezone
-from sqlalchemy import Index, func, text, String
+from sqlalchemy import Index, JSON, func, text, String
 from sqlalchemy.dialects import postgresql
 from src.app import db
 from typing import Optional
@@ -101,3 +101,38 @@ class DocumentChunk(db.Model):
     def __repr__(self) -> str:
         return f"<DocumentChunk {self.id} doc={self.document_id} idx={self.chunk_index}>"
 
+
+
+class UploadStatus(db.Model):
+    """Tracks a background Library Tool upload so any app worker can report it."""
+    
+    __tablename__ = 'upload_status'
+    __table_args__ = {'extend_existing': True}
+
+    id = db.Column(db.String(36), primary_key=True)  # job ID (uuid4)
+    owner_id = db.Column(
+        db.Integer,
+        db.ForeignKey("user.id", ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    status = db.Column(db.String(20), nullable=False, default='queued')  # 'queued', 'running', 'done'
+    http_status = db.Column(db.Integer, nullable=True)
+    result = db.Column(JSON, nullable=True)
+    # Spooled upload awaiting processing; cleared once the job has consumed it
+    tmp_path = db.Column(db.String(1024), nullable=True)
+    created_at = db.Column(
+        db.DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<UploadStatus {self.id} {self.status}>"
@@ -6,7 +6,7 @@ Railway PostgreSQL helpers for document operations.
 from typing import Optional, List
 from src.app import db
 from src.models.document import Document, DocumentChunk
-from sqlalchemy import func
+from sqlalchemy import func, inspect, text
 from flask import current_app
 
 # Synthesis mode configuration constants
@@ -15,6 +15,33 @@ SYNTHESIS_MAX_TOTAL_CHUNKS = 10
 SYNTHESIS_CHUNK_TEXT_LIMIT = 400
 SYNTHESIS_TOKEN_BUDGET = 1000
 
+# O(1) lookup against the trigger-maintained counter (see room_storage migration)
+_ROOM_STORAGE_QUERY = text(
+    "SELECT total_bytes, file_count FROM room_storage WHERE room_id = :room_id"
+)
+
+_ROOM_VERSION_QUERY = text(
+    "SELECT version FROM room_storage WHERE room_id = :room_id"
+)
+
+# Whether the room_storage counter table exists; resolved once per process
+_room_storage_available: Optional[bool] = None
+
+
+def _has_room_storage_counter() -> bool:
+    """Check (once) whether the room_storage counter table is available."""
+    global _room_storage_available
+    if _room_storage_available is None:
+        try:
+            engine = db.engine
+            _room_storage_available = (
+                engine.dialect.name == 'postgresql'
+                and inspect(engine).has_table('room_storage')
+            )
+        except Exception:
+            _room_storage_available = False
+    return _room_storage_available
+
 
 def get_document_by_file_id(file_id: str, room_id: Optional[int] = None) -> Optional[Document]:
     """
@@ -61,6 +88,28 @@ def get_all_documents(room_id: Optional[int] = None) -> List[Document]:
         return []
 
 
+def get_room_documents_version(room_id: int) -> Optional[int]:
+    """
+    Get the room's document version, bumped by triggers on every document write.
+    
+    Args:
+        room_id: Room ID to check
+        
+    Returns:
+        Version number (0 if the room has never had documents), or None when the
+        room_storage counter is unavailable and callers must not cache
+    """
+    if not _has_room_storage_counter():
+        return None
+    try:
+        version = db.session.execute(_ROOM_VERSION_QUERY, {'room_id': room_id}).scalar()
+        return int(version or 0)
+    except Exception as e:
+        current_app.logger.warning(f"Could not read room_storage version: {e}")
+        db.session.rollback()
+        return None
+
+
 def get_room_storage_usage(room_id: int) -> dict:
     """
     Get storage usage statistics for a room.
@@ -74,13 +123,18 @@ def get_room_storage_usage(room_id: int) -> dict:
     STORAGE_LIMIT_BYTES = 10 * 1024 * 1024  # 10MB
     
     try:
-        result = db.session.query(
-            func.sum(Document.file_size).label('total_bytes'),
-            func.count(Document.id).label('file_count')
-        ).filter_by(room_id=room_id).first()
+        if _has_room_storage_counter():
+            # Counter row is absent until the room's first upload
+            result = db.session.execute(_ROOM_STORAGE_QUERY, {'room_id': room_id}).first()
+        else:
+            # Fallback for databases without the counter table (SQLite, migration not run)
+            result = db.session.query(
+                func.sum(Document.file_size).label('total_bytes'),
+                func.count(Document.id).label('file_count')
+            ).filter_by(room_id=room_id).first()
         
-        total_bytes = int(result.total_bytes or 0)
-        file_count = int(result.file_count or 0)
+        total_bytes = int(result.total_bytes or 0) if result else 0
+        file_count = int(result.file_count or 0) if result else 0
     except Exception as e:
         # Tables don't exist (migration not run) - return empty stats
         from flask import current_app
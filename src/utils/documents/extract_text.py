@@ -4,7 +4,7 @@ Supports PDF, DOCX, and TXT files with AI summarization.
 """
 
 import os
-from typing import Dict, Any
+from typing import Any, BinaryIO, Callable, Dict, Optional, Union
 from werkzeug.datastructures import FileStorage
 from anthropic import Anthropic
 
@@ -40,13 +40,13 @@ def is_plain_text(file: FileStorage) -> bool:
     return content_type.startswith('text/') or ext in ('txt', 'md', 'csv', 'log')
 
 
-def extract_pdf_text(file_data: bytes) -> str:
-    """Extract text from PDF using pypdf."""
+def extract_pdf_text(file_data: Union[bytes, BinaryIO]) -> str:
+    """Extract text from PDF using pypdf (bytes or an open binary file)."""
     try:
         from pypdf import PdfReader
         from io import BytesIO
         
-        pdf_file = BytesIO(file_data)
+        pdf_file = BytesIO(file_data) if isinstance(file_data, bytes) else file_data
         reader = PdfReader(pdf_file)
         
         text_parts = []
@@ -60,13 +60,13 @@ def extract_pdf_text(file_data: bytes) -> str:
         raise Exception(f"Failed to parse PDF file: {str(e)}")
 
 
-def extract_docx_text(file_data: bytes) -> str:
-    """Extract text from DOCX using python-docx."""
+def extract_docx_text(file_data: Union[bytes, BinaryIO]) -> str:
+    """Extract text from DOCX using python-docx (bytes or an open binary file)."""
     try:
         from docx import Document
         from io import BytesIO
         
-        docx_file = BytesIO(file_data)
+        docx_file = BytesIO(file_data) if isinstance(file_data, bytes) else file_data
         doc = Document(docx_file)
         
         text_parts = []
@@ -103,6 +103,29 @@ def convert_file_to_text(file: FileStorage) -> str:
         raise ValueError(f"Unsupported file type: {file.content_type}")
 
 
+def convert_path_to_text(path: str, filename: str, content_type: Optional[str] = None) -> str:
+    """
+    Convert a file saved on disk to text based on its original name and type.
+    
+    PDF and DOCX parsers read straight from the file, so the document is not
+    also held in memory as one bytes object.
+    """
+    # Reuse the FileStorage-based type checks with an empty stream
+    probe = FileStorage(filename=filename, content_type=content_type)
+    
+    if is_pdf(probe):
+        with open(path, 'rb') as fh:
+            return extract_pdf_text(fh)
+    elif is_docx(probe):
+        with open(path, 'rb') as fh:
+            return extract_docx_text(fh)
+    elif is_plain_text(probe):
+        with open(path, 'rb') as fh:
+            return extract_plain_text(fh.read())
+    else:
+        raise ValueError(f"Unsupported file type: {content_type}")
+
+
 def truncate(text: str, limit: int) -> str:
     """Truncate text to specified character limit."""
     return text[:limit] if len(text) > limit else text
@@ -156,3 +179,35 @@ def extract_text(file: FileStorage) -> Dict[str, str]:
         'summary': summary
     }
 
+
+def extract_text_from_path(
+    path: str,
+    filename: str,
+    content_type: Optional[str] = None,
+    run: Optional[Callable[..., str]] = None
+) -> Dict[str, str]:
+    """
+    Extract and process text from a file saved on disk (see extract_text).
+    
+    Args:
+        path: File to read
+        filename: Original file name (used to detect the type)
+        content_type: Original MIME type
+        run: Optional run(func, *args) used for the CPU-bound parse, e.g. to
+            move it into a process pool; called inline when omitted
+    
+    Returns:
+        Dict with fullText, firstChunks, and summary
+    """
+    if run is None:
+        full_text = convert_path_to_text(path, filename, content_type)
+    else:
+        full_text = run(convert_path_to_text, path, filename, content_type)
+    first_chunks = truncate(full_text, PREVIEW_CHAR_LIMIT)
+    summary = summarize_text(full_text)
+    
+    return {
+        'fullText': full_text,
+        'firstChunks': first_chunks,
+        'summary': summary
+    }
@@ -7,7 +7,7 @@ Includes feature flag for safe migration and Supabase fallback.
 import os
 from typing import List, Dict, Any, Optional
 from uuid import uuid4
-from sqlalchemy import func, text
+from sqlalchemy import func, insert, text
 from flask import current_app
 from src.app import db
 from src.models.document import Document, DocumentChunk
@@ -18,6 +18,65 @@ from src.utils.documents.chunking import chunk_text, Chunk, get_chunk_stats
 # Default to Railway-only (no Supabase fallback available in this codebase)
 USE_RAILWAY_DOCUMENTS = os.getenv('USE_RAILWAY_DOCUMENTS', 'true').lower() == 'true'
 ENABLE_RAILWAY_FALLBACK = os.getenv('ENABLE_RAILWAY_FALLBACK', 'false').lower() == 'true'
+# Server-side prepared search statements; disable behind transaction-pooling
+# proxies (e.g. PgBouncer) that don't keep session state between transactions
+USE_PREPARED_SEARCH = os.getenv('USE_PREPARED_SEARCH', 'true').lower() == 'true'
+
+# Column order of search_railway(..., as_rows=True) results
+SEARCH_ROW_COLUMNS = ('document_name', 'chunk_text', 'chunk_index', 'rank')
+
+# Rows per multi-row INSERT statement when storing chunks (non-PostgreSQL)
+CHUNK_INSERT_PAGE_SIZE = 500
+
+# PostgreSQL: insert every chunk of a document in one round trip from parallel
+# arrays. {vector_column}/{vector_value} fill search_vector only when the
+# migration's trigger is absent (tables created by create_app); otherwise the
+# trigger sets it and computing it here too would parse every chunk twice.
+_INSERT_CHUNKS_POSTGRES_TEMPLATE = """
+    INSERT INTO document_chunk
+        (document_id, chunk_index, chunk_text, start_char, end_char, token_count{vector_column})
+    SELECT :document_id, c.chunk_index, c.chunk_text, c.start_char, c.end_char, c.token_count{vector_value}
+    FROM unnest(
+        CAST(:chunk_indexes AS INTEGER[]),
+        CAST(:chunk_texts AS TEXT[]),
+        CAST(:start_chars AS INTEGER[]),
+        CAST(:end_chars AS INTEGER[]),
+        CAST(:token_counts AS INTEGER[])
+    ) AS c(chunk_index, chunk_text, start_char, end_char, token_count)
+"""
+_INSERT_CHUNKS_POSTGRES = text(_INSERT_CHUNKS_POSTGRES_TEMPLATE.format(
+    vector_column='', vector_value=''
+))
+_INSERT_CHUNKS_POSTGRES_WITH_VECTOR = text(_INSERT_CHUNKS_POSTGRES_TEMPLATE.format(
+    vector_column=', search_vector', vector_value=",\n           to_tsvector('english', c.chunk_text)"
+))
+
+_SEARCH_VECTOR_TRIGGER_QUERY = text("""
+    SELECT EXISTS (
+        SELECT 1 FROM pg_trigger
+        WHERE tgrelid = to_regclass('document_chunk')
+          AND tgname = 'document_chunk_search_vector_update'
+          AND NOT tgisinternal
+    )
+""")
+
+# Whether the migration's search_vector trigger exists; resolved once per process
+_search_vector_trigger_available: Optional[bool] = None
+
+
+def _has_search_vector_trigger() -> bool:
+    """Check (once) whether document_chunk has the search_vector trigger."""
+    global _search_vector_trigger_available
+    if _search_vector_trigger_available is None:
+        try:
+            with db.engine.connect() as conn:
+                _search_vector_trigger_available = bool(
+                    conn.execute(_SEARCH_VECTOR_TRIGGER_QUERY).scalar()
+                )
+        except Exception:
+            # Unknown: fill search_vector ourselves so chunks stay searchable
+            _search_vector_trigger_available = False
+    return _search_vector_trigger_available
 
 
 def index_document_railway(
@@ -80,20 +139,38 @@ def index_document_railway(
         db.session.add(document)
         db.session.flush()  # Get document.id
         
-        # Insert chunks
-        chunk_objects = []
-        for chunk in chunks:
-            chunk_obj = DocumentChunk(
-                document_id=document.id,
-                chunk_index=chunk.index,
-                chunk_text=chunk.text,
-                start_char=chunk.start_char,
-                end_char=chunk.end_char,
-                token_count=chunk.token_count
-            )
-            chunk_objects.append(chunk_obj)
-        
-        db.session.bulk_save_objects(chunk_objects)
+        if chunks:
+            if db.session.get_bind().dialect.name == 'postgresql':
+                # One statement for all chunks; search_vector comes from the trigger when present
+                statement = (
+                    _INSERT_CHUNKS_POSTGRES if _has_search_vector_trigger()
+                    else _INSERT_CHUNKS_POSTGRES_WITH_VECTOR
+                )
+                db.session.execute(statement, {
+                    'document_id': document.id,
+                    'chunk_indexes': [chunk.index for chunk in chunks],
+                    'chunk_texts': [chunk.text for chunk in chunks],
+                    'start_chars': [chunk.start_char for chunk in chunks],
+                    'end_chars': [chunk.end_char for chunk in chunks],
+                    'token_counts': [chunk.token_count for chunk in chunks]
+                })
+            else:
+                # Other databases: one multi-row INSERT per page instead of ORM objects
+                db.session.execute(
+                    insert(DocumentChunk.__table__),
+                    [
+                        {
+                            'document_id': document.id,
+                            'chunk_index': chunk.index,
+                            'chunk_text': chunk.text,
+                            'start_char': chunk.start_char,
+                            'end_char': chunk.end_char,
+                            'token_count': chunk.token_count
+                        }
+                        for chunk in chunks
+                    ],
+                    execution_options={'insertmanyvalues_page_size': CHUNK_INSERT_PAGE_SIZE}
+                )
         db.session.commit()
         
         current_app.logger.info(
@@ -114,12 +191,72 @@ def index_document_railway(
         raise Exception(f"Indexing failed for {file_name}: {str(e)}")
 
 
+# Server-side prepared search statements, created once per pooled PostgreSQL
+# connection so repeat searches skip parse/plan. Parameters: $1 search terms,
+# $2 room_id, $3 min_rank, $4 limit. The row variant selects SEARCH_ROW_COLUMNS.
+_SEARCH_SELECT_ROWS = "d.name AS document_name, c.chunk_text, c.chunk_index, ts_rank(c.search_vector, q) AS rank"
+_SEARCH_SELECT_FULL = "c.id AS chunk_id, c.document_id, " + _SEARCH_SELECT_ROWS
+_PREPARED_SEARCHES = {
+    as_rows: (name, text(f"""
+        PREPARE {name} (text, integer, real, integer) AS
+        SELECT {select_list}
+        FROM document_chunk c
+        JOIN document d ON c.document_id = d.id
+        CROSS JOIN websearch_to_tsquery('english', $1) AS q
+        WHERE d.room_id = $2
+          AND c.search_vector @@ q
+          AND ts_rank(c.search_vector, q) > $3
+        ORDER BY rank DESC, c.document_id, c.chunk_index
+        LIMIT $4
+    """), text(f"EXECUTE {name}(:search_query, :room_id, :min_rank, :limit)"))
+    for as_rows, name, select_list in (
+        (True, 'library_search_rows', _SEARCH_SELECT_ROWS),
+        (False, 'library_search', _SEARCH_SELECT_FULL),
+    )
+}
+_PREPARED_SEARCH_EXISTS = text("SELECT 1 FROM pg_prepared_statements WHERE name = :name")
+
+
+def _search_prepared(search_query: str, room_id: int, limit: int, min_rank: float, as_rows: bool):
+    """
+    Run a search through the per-connection prepared statement.
+    
+    Returns:
+        Result rows, or None if the statement could not be used (caller falls back)
+    """
+    name, prepare, execute = _PREPARED_SEARCHES[as_rows]
+    connection = db.session.connection()
+    prepared = connection.connection.info.setdefault('library_prepared_searches', set())
+    try:
+        # SAVEPOINT: a failure rolls back only this attempt, not the caller's pending work
+        with db.session.begin_nested():
+            if name not in prepared:
+                # PREPARE survives ROLLBACK, so after an earlier failure the statement
+                # may still exist on this connection; only create it when missing
+                if connection.execute(_PREPARED_SEARCH_EXISTS, {'name': name}).first() is None:
+                    connection.execute(prepare)
+                prepared.add(name)
+            return connection.execute(execute, {
+                'search_query': search_query,
+                'room_id': room_id,
+                'min_rank': min_rank,
+                'limit': limit
+            }).all()
+    except Exception as e:
+        # e.g. a statement timeout, or the statement was discarded by a connection
+        # reset; check pg_prepared_statements again next time
+        current_app.logger.warning(f"Prepared search unavailable, using ad-hoc query: {e}")
+        prepared.discard(name)
+        return None
+
+
 def search_railway(
     query: str,
     room_id: int,
     limit: int = 5,
-    min_rank: float = 0.01
-) -> List[Dict[str, Any]]:
+    min_rank: float = 0.01,
+    as_rows: bool = False
+) -> List[Any]:
     """
     Search chunks using PostgreSQL Full-Text Search via SQLAlchemy.
     
@@ -128,47 +265,23 @@ def search_railway(
         room_id: Room ID to scope search
         limit: Maximum results
         min_rank: Minimum relevance score
+        as_rows: Select only SEARCH_ROW_COLUMNS and return the rows as-is
         
     Returns:
-        List of matching chunks with metadata
+        List of matching chunks with metadata, or SEARCH_ROW_COLUMNS rows if as_rows
     """
     # Extract meaningful terms (keep existing function)
     search_query = extract_search_terms(query)
     
     try:
-        # Build query using SQLAlchemy
-        # Note: search_vector is TSVECTOR type, so we can use it directly
-        search_query_ts = func.websearch_to_tsquery('english', search_query)
-        
-        base_query = db.session.query(
-            DocumentChunk.id.label('chunk_id'),
-            DocumentChunk.document_id,
-            Document.name.label('document_name'),
-            DocumentChunk.chunk_text,
-            DocumentChunk.chunk_index,
-            func.ts_rank(
-                DocumentChunk.search_vector,
-                search_query_ts
-            ).label('rank')
-        ).join(
-            Document, DocumentChunk.document_id == Document.id
-        ).filter(
-            Document.room_id == room_id
-        ).filter(
-            DocumentChunk.search_vector.op('@@')(search_query_ts)
-        )
+        results = None
+        if USE_PREPARED_SEARCH and db.session.get_bind().dialect.name == 'postgresql':
+            results = _search_prepared(search_query, room_id, limit, min_rank, as_rows)
+        if results is None:
+            results = _search_orm(search_query, room_id, limit, min_rank, as_rows)
         
-        # Filter by minimum rank and order
-        results = base_query.filter(
-            func.ts_rank(
-                DocumentChunk.search_vector,
-                search_query_ts
-            ) > min_rank
-        ).order_by(
-            text('rank DESC'),
-            DocumentChunk.document_id,
-            DocumentChunk.chunk_index
-        ).limit(limit).all()
+        if as_rows:
+            return results
         
         # Format results
         formatted_results = []
@@ -189,6 +302,49 @@ def search_railway(
         return []
 
 
+def _search_orm(search_query: str, room_id: int, limit: int, min_rank: float, as_rows: bool):
+    """Build and run the search query with the ORM (non-prepared path)."""
+    # Build query using SQLAlchemy
+    # Note: search_vector is TSVECTOR type, so we can use it directly
+    search_query_ts = func.websearch_to_tsquery('english', search_query)
+    rank = func.ts_rank(
+        DocumentChunk.search_vector,
+        search_query_ts
+    ).label('rank')
+    
+    if as_rows:
+        columns = (Document.name, DocumentChunk.chunk_text, DocumentChunk.chunk_index, rank)
+    else:
+        columns = (
+            DocumentChunk.id.label('chunk_id'),
+            DocumentChunk.document_id,
+            Document.name.label('document_name'),
+            DocumentChunk.chunk_text,
+            DocumentChunk.chunk_index,
+            rank
+        )
+    
+    base_query = db.session.query(*columns).join(
+        Document, DocumentChunk.document_id == Document.id
+    ).filter(
+        Document.room_id == room_id
+    ).filter(
+        DocumentChunk.search_vector.op('@@')(search_query_ts)
+    )
+    
+    # Filter by minimum rank and order
+    return base_query.filter(
+        func.ts_rank(
+            DocumentChunk.search_vector,
+            search_query_ts
+        ) > min_rank
+    ).order_by(
+        text('rank DESC'),
+        DocumentChunk.document_id,
+        DocumentChunk.chunk_index
+    ).limit(limit).all()
+
+
 def index_document_supabase(
     file_id: str,
     file_name: str,
@@ -386,17 +542,19 @@ def search_indexed_chunks(
     query: str,
     room_id: int,
     limit: int = 5,
-    min_rank: float = 0.01
-) -> List[Dict[str, Any]]:
+    min_rank: float = 0.01,
+    as_rows: bool = False
+) -> List[Any]:
     """
     Search chunks with Railway and Supabase fallback.
     
     If Railway is enabled, tries Railway first, then falls back to Supabase
-    if Railway fails or returns empty results.
+    if Railway fails or returns empty results. With as_rows, results are
+    SEARCH_ROW_COLUMNS rows instead of dicts (see search_railway).
     """
     if USE_RAILWAY_DOCUMENTS:
         try:
-            results = search_railway(query, room_id, limit, min_rank)
+            results = search_railway(query, room_id, limit, min_rank, as_rows=as_rows)
             if results:
                 current_app.logger.info(
                     f"Railway search successful: {len(results)} results for room {room_id}"
@@ -607,6 +765,56 @@ def delete_document_and_chunks(file_id: str, room_id: int = None) -> bool:
         return False
 
 
+def delete_documents_and_chunks_bulk(file_ids: List[str], room_id: int) -> int:
+    """
+    Delete several documents and their chunks in one transaction.
+    
+    Issues one DELETE for the chunks and one for the documents instead of a
+    lookup, delete and commit per file_id.
+    
+    Args:
+        file_ids: Application file identifiers
+        room_id: Room ID for scoping (required)
+        
+    Returns:
+        Number of documents deleted (0 on error)
+    """
+    if not file_ids:
+        return 0
+    
+    if USE_RAILWAY_DOCUMENTS:
+        try:
+            unique_ids = set(file_ids)
+            document_ids = db.session.query(Document.id).filter(
+                Document.room_id == room_id,
+                Document.file_id.in_(unique_ids)
+            ).scalar_subquery()
+            
+            # Chunks are removed explicitly so SQLite (no FK cascade by default) behaves like PostgreSQL
+            DocumentChunk.query.filter(
+                DocumentChunk.document_id.in_(document_ids)
+            ).delete(synchronize_session=False)
+            deleted_count = Document.query.filter(
+                Document.room_id == room_id,
+                Document.file_id.in_(unique_ids)
+            ).delete(synchronize_session=False)
+            
+            db.session.commit()
+            current_app.logger.info(f"Railway: Deleted {deleted_count} documents from room {room_id}")
+            return deleted_count
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"Railway bulk delete error: {e}")
+            return 0
+    else:
+        # Railway disabled - Supabase not available
+        current_app.logger.error(
+            "USE_RAILWAY_DOCUMENTS=false but Supabase not available. "
+            "Set USE_RAILWAY_DOCUMENTS=true to enable Library Tool."
+        )
+        return 0
+
+
 def delete_all_documents(room_id: int = None) -> bool:
     """
     Delete all documents and chunks.
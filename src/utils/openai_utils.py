@@ -4,11 +4,12 @@ Simplified version focusing only on Anthropic API.
 """
 
 import os
+import random
 import requests
 import time
 from flask import current_app
 from collections import namedtuple
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Iterator
 
 
 def get_client_type() -> str:
@@ -546,6 +547,121 @@ Building on all these insights from your learning journey, let's continue with t
     return base_prompt
 
 
+# Attempts per model for transient Anthropic errors (rate limits, 5xx, overload)
+ANTHROPIC_MAX_RETRIES = 2
+
+
+def _get_model_max_tokens(model_name: str) -> int:
+    """
+    Get the maximum output tokens allowed for a specific model.
+    Returns a high default if model not in the list.
+    """
+    model_limits = {
+        "claude-3-haiku-20240307": 4096,  # Legacy Haiku has lower limit
+        "claude-3-5-haiku-20241022": 8192,  # Current Haiku
+        "claude-3-5-sonnet-20241022": 8192,  # Current Sonnet
+        "claude-3-5-sonnet-20240620": 8192,  # Alternative Sonnet
+        "claude-3-opus-20240229": 4096,  # Legacy Opus
+    }
+    # Default to high limit for unknown models (they likely support 8192+)
+    return model_limits.get(model_name, 8192)
+
+
+def _get_candidate_models(requested_max_tokens: int) -> List[str]:
+    """
+    Build a fallback list of models that can handle the requested token count.
+    - Start with explicit env override if provided.
+    - Then try current stable/known-good models.
+    - Filter out models that can't handle the requested max_tokens.
+    """
+    primary = os.getenv("ANTHROPIC_MODEL")
+    all_candidates = [
+        primary,
+        "claude-3-5-sonnet-20241022",  # widely available, strong quality
+        "claude-3-5-haiku-20241022",   # fast
+        "claude-3-5-sonnet-20240620",  # alternative sonnet version
+        "claude-3-haiku-20240307",     # legacy, broad availability (lower limit)
+    ]
+
+    # Filter models that can handle the requested token count
+    candidates = []
+    seen = set()
+    for c in all_candidates:
+        if c and c not in seen:
+            seen.add(c)
+            model_max = _get_model_max_tokens(c)
+            if requested_max_tokens <= model_max:
+                candidates.append(c)
+            else:
+                try:
+                    current_app.logger.debug(f"Skipping model {c} (max {model_max} tokens) for request requiring {requested_max_tokens} tokens")
+                except:
+                    pass
+
+    return candidates
+
+
+def _anthropic_error_action(e: Exception, model: str, attempt: int, max_retries: int) -> Tuple[str, Any]:
+    """
+    Decide how to handle an error from an Anthropic API attempt.
+
+    Returns:
+        ('raise', exception) when retrying can't help (bad API key),
+        ('retry', delay_seconds) to try the same model again after a jittered pause,
+        ('next_model', error) to move on to the next candidate model
+    """
+    error_str = str(e)
+
+    # Try to extract status code from error
+    if "401" in error_str or "unauthorized" in error_str.lower():
+        return 'raise', Exception(f"Anthropic API authentication failed. Check your API key: {str(e)}")
+    elif "404" in error_str and "model" in error_str.lower():
+        # Model not found; try next candidate if available
+        try:
+            current_app.logger.warning(f"Anthropic model '{model}' not found (404). Trying next fallback model if available.")
+        except:
+            pass
+        return 'next_model', e
+    elif "404" in error_str:
+        # If it's a 404 but not model-related, it might be an endpoint issue
+        try:
+            current_app.logger.warning(f"Anthropic API endpoint not found (404). Trying next model if available.")
+        except:
+            pass
+        return 'next_model', e
+    elif "429" in error_str or "rate limit" in error_str.lower():
+        # Retry on rate limit
+        if attempt < max_retries - 1:
+            jitter = random.uniform(0.5, 1.5)
+            try:
+                current_app.logger.warning(f"⚠️ Rate limit, retrying in {jitter:.2f}s")
+            except:
+                pass
+            return 'retry', jitter
+        return 'next_model', Exception(f"Anthropic API rate limit exceeded: {str(e)}")
+    elif any(code in error_str for code in ("500", "502", "503", "504", "529")) or "overloaded" in error_str.lower():
+        # Retry on server errors and overload
+        if attempt < max_retries - 1:
+            jitter = random.uniform(0.5, 1.0)
+            try:
+                current_app.logger.warning(f"⚠️ Server error, retrying in {jitter:.2f}s")
+            except:
+                pass
+            return 'retry', jitter
+        return 'next_model', Exception(f"Anthropic API server error: {str(e)}")
+
+    # Non-retryable error or max retries reached
+    if attempt < max_retries - 1:
+        jitter = random.uniform(0.2, 0.5)
+        try:
+            current_app.logger.warning(f"⚠️ API error, retrying in {jitter:.2f}s")
+        except:
+            pass
+        return 'retry', jitter
+
+    return 'next_model', Exception(f"Anthropic API call failed: {str(e)}")
+
+
 def call_anthropic_api(messages: List[Dict[str, str]], system_prompt: str = "", max_tokens: int = 300) -> Tuple[str, bool]:
     """Call Anthropic API with the given messages using the official SDK."""
     api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -557,54 +673,6 @@ def call_anthropic_api(messages: List[Dict[str, str]], system_prompt: str = "",
     except ImportError:
         raise Exception("Anthropic SDK not installed. Install with: pip install anthropic")
 
-    def _get_model_max_tokens(model_name: str) -> int:
-        """
-        Get the maximum output tokens allowed for a specific model.
-        Returns a high default if model not in the list.
-        """
-        model_limits = {
-            "claude-3-haiku-20240307": 4096,  # Legacy Haiku has lower limit
-            "claude-3-5-haiku-20241022": 8192,  # Current Haiku
-            "claude-3-5-sonnet-20241022": 8192,  # Current Sonnet
-            "claude-3-5-sonnet-20240620": 8192,  # Alternative Sonnet
-            "claude-3-opus-20240229": 4096,  # Legacy Opus
-        }
-        # Default to high limit for unknown models (they likely support 8192+)
-        return model_limits.get(model_name, 8192)
-    
-    def _get_candidate_models(requested_max_tokens: int) -> List[str]:
-        """
-        Build a fallback list of models that can handle the requested token count.
-        - Start with explicit env override if provided.
-        - Then try current stable/known-good models.
-        - Filter out models that can't handle the requested max_tokens.
-        """
-        primary = os.getenv("ANTHROPIC_MODEL")
-        all_candidates = [
-            primary,
-            "claude-3-5-sonnet-20241022",  # widely available, strong quality
-            "claude-3-5-haiku-20241022",   # fast
-            "claude-3-5-sonnet-20240620",  # alternative sonnet version
-            "claude-3-haiku-20240307",     # legacy, broad availability (lower limit)
-        ]
-        
-        # Filter models that can handle the requested token count
-        candidates = []
-        seen = set()
-        for c in all_candidates:
-            if c and c not in seen:
-                seen.add(c)
-                model_max = _get_model_max_tokens(c)
-                if requested_max_tokens <= model_max:
-                    candidates.append(c)
-                else:
-                    try:
-                        current_app.logger.debug(f"Skipping model {c} (max {model_max} tokens) for request requiring {requested_max_tokens} tokens")
-                    except:
-                        pass
-        
-        return candidates
-
     # Convert messages to Anthropic format
     anthropic_messages = []
     for msg in messages:
@@ -614,8 +682,7 @@ def call_anthropic_api(messages: List[Dict[str, str]], system_prompt: str = "",
             anthropic_messages.append({"role": role, "content": content})
 
     # Retry logic for transient errors
-    import random
-    max_retries = 2
+    max_retries = ANTHROPIC_MAX_RETRIES
     candidate_models = _get_candidate_models(max_tokens)
     
     if not candidate_models:
@@ -666,63 +733,13 @@ def call_anthropic_api(messages: List[Dict[str, str]], system_prompt: str = "",
                 return response_text, is_truncated
 
             except Exception as e:
-                error_str = str(e)
-                last_error = e
-                
-                # Try to extract status code from error
-                if "401" in error_str or "unauthorized" in error_str.lower():
-                    raise Exception(f"Anthropic API authentication failed. Check your API key: {str(e)}")
-                elif "404" in error_str and "model" in error_str.lower():
-                    # Model not found; try next candidate if available
-                    try:
-                        current_app.logger.warning(f"Anthropic model '{model}' not found (404). Trying next fallback model if available.")
-                    except:
-                        pass
-                    break  # move to next model
-                elif "404" in error_str:
-                    # If it's a 404 but not model-related, it might be an endpoint issue
-                    try:
-                        current_app.logger.warning(f"Anthropic API endpoint not found (404). Trying next model if available.")
-                    except:
-                        pass
-                    break  # move to next model
-                    break
-                elif "429" in error_str or "rate limit" in error_str.lower():
-                    # Retry on rate limit
-                    if attempt < max_retries - 1:
-                        jitter = random.uniform(0.5, 1.5)
-                        try:
-                            current_app.logger.warning(f"⚠️ Rate limit, retrying in {jitter:.2f}s")
-                        except:
-                            pass
-                        time.sleep(jitter)
-                        continue
-                    last_error = Exception(f"Anthropic API rate limit exceeded: {str(e)}")
-                    break
-                elif "500" in error_str or "502" in error_str or "503" in error_str or "504" in error_str:
-                    # Retry on server errors
-                    if attempt < max_retries - 1:
-                        jitter = random.uniform(0.5, 1.0)
-                        try:
-                            current_app.logger.warning(f"⚠️ Server error, retrying in {jitter:.2f}s")
-                        except:
-                            pass
-                        time.sleep(jitter)
-                        continue
-                    last_error = Exception(f"Anthropic API server error: {str(e)}")
-                    break
-                
-                # Non-retryable error or max retries reached
-                if attempt < max_retries - 1:
-                    jitter = random.uniform(0.2, 0.5)
-                    try:
-                        current_app.logger.warning(f"⚠️ API error, retrying in {jitter:.2f}s")
-                    except:
-                        pass
-                    time.sleep(jitter)
+                action, value = _anthropic_error_action(e, model, attempt, max_retries)
+                if action == 'raise':
+                    raise value
+                if action == 'retry':
+                    time.sleep(value)
                     continue
-                
-                last_error = Exception(f"Anthropic API call failed: {str(e)}")
+                last_error = value
                 break  # break inner loop to try next model if any
     
     # Exhausted all models
@@ -743,6 +760,69 @@ def call_anthropic_api(messages: List[Dict[str, str]], system_prompt: str = "",
     raise Exception("Anthropic API call failed: no models available to try")
 
 
+def stream_anthropic_api(messages: List[Dict[str, Any]], system_prompt: str = "", max_tokens: int = 300) -> Iterator[str]:
+    """
+    Stream an Anthropic response as text deltas.
+
+    Uses the same retries and model fallback as call_anthropic_api, but only
+    for errors raised before any text has been produced; once deltas have been
+    yielded an error propagates, since the caller has already consumed part of
+    the reply.
+    """
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise Exception("ANTHROPIC_API_KEY not found in environment variables")
+
+    try:
+        from anthropic import Anthropic
+    except ImportError:
+        raise Exception("Anthropic SDK not installed. Install with: pip install anthropic")
+
+    anthropic_messages = [
+        {"role": msg.get("role", "user"), "content": msg.get("content")}
+        for msg in messages
+        if msg.get("role", "user") != "system" and msg.get("content")
+    ]
+
+    candidate_models = _get_candidate_models(max_tokens)
+    if not candidate_models:
+        raise Exception(f"No Anthropic models available that support {max_tokens} output tokens.")
+
+    client = Anthropic(api_key=api_key)
+    last_error = None
+    for model in candidate_models:
+        params = {
+            'model': model,
+            'max_tokens': min(max_tokens, _get_model_max_tokens(model)),
+            'messages': anthropic_messages,
+        }
+        if system_prompt:
+            params['system'] = system_prompt
+        for attempt in range(ANTHROPIC_MAX_RETRIES):
+            started = False
+            try:
+                with client.messages.stream(**params) as stream:
+                    for text in stream.text_stream:
+                        started = True
+                        yield text
+                return
+            except Exception as e:
+                if started:
+                    raise
+                # Nothing consumed yet: same retry/fallback policy as call_anthropic_api
+                action, value = _anthropic_error_action(e, model, attempt, ANTHROPIC_MAX_RETRIES)
+                if action == 'raise':
+                    raise value
+                if action == 'retry':
+                    time.sleep(value)
+                    continue
+                last_error = value
+                break
+
+    tried = ", ".join(candidate_models)
+    raise Exception(f"Anthropic API stream failed after trying models [{tried}]: {last_error}")
+
+
 def _get_pin_chat_system_prompt(chat: Any) -> str:
     """
     Build system prompt for a pin-seeded chat.
@@ -0,0 +1,424 @@
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+# Ensure tests use in-memory database before app imports
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+from src.main import app as flask_app  # noqa: E402
+from src.app import db, limiter  # noqa: E402
+from src.app.library import access_control as library_access  # noqa: E402
+from src.app.library import jobs as library_jobs  # noqa: E402
+from src.app.library.schemas import ClearRequest, SearchRequest  # noqa: E402
+from src.models import User, Room, RoomMember, UploadStatus  # noqa: E402
+
+
+class _InlineExecutor:
+    """Runs upload jobs on the calling thread.
+
+    The in-memory test database is a single connection, which worker threads
+    must not use concurrently with the request thread.
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+@pytest.fixture
+def test_client(monkeypatch):
+    """Return a Flask test client with a fresh in-memory database.
+
+    The app context is only held around setup and teardown so that every
+    request gets its own context (and its own ``g``).
+    """
+    flask_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+    library_access.invalidate(None)
+    # Job polling would otherwise run into the default hourly limit
+    monkeypatch.setattr(limiter, "enabled", False)
+    monkeypatch.setattr(library_jobs, "_EXECUTOR", _InlineExecutor())
+
+    yield flask_app.test_client()
+
+    library_access.invalidate(None)
+    with flask_app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+
+def _create_user(username):
+    user = User(
+        username=username,
+        email=f"{username}@example.com",
+        display_name=username.title(),
+        password_hash="hashed-password",
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user.id
+
+
+def _create_room_with_member():
+    """Create an owner, a room and a member; returns (owner_id, member_id, room_id, membership_id)."""
+    owner_id = _create_user("owner")
+    member_id = _create_user("member")
+
+    room = Room(name="Library Room", description="Library tests", owner_id=owner_id)
+    db.session.add(room)
+    db.session.commit()
+
+    membership = RoomMember(room_id=room.id, user_id=member_id)
+    db.session.add(membership)
+    db.session.commit()
+    return owner_id, member_id, room.id, membership.id
+
+
+def _login(client, user_id):
+    with client.session_transaction() as session:
+        session["user_id"] = user_id
+
+
+def test_removed_member_is_refused_on_next_request(test_client):
+    """Removing a member drops their cached library grant immediately."""
+    with flask_app.app_context():
+        owner_id, member_id, room_id, membership_id = _create_room_with_member()
+
+    _login(test_client, member_id)
+    assert test_client.get(f"/api/library/storage/stats?room_id={room_id}").status_code == 200
+
+    _login(test_client, owner_id)
+    test_client.post(f"/room/{room_id}/remove/{membership_id}")
+    with flask_app.app_context():
+        assert RoomMember.query.get(membership_id) is None
+
+    _login(test_client, member_id)
+    assert test_client.get(f"/api/library/storage/stats?room_id={room_id}").status_code == 403
+
+
+def test_deactivated_room_is_refused_on_next_request(test_client):
+    """Soft-deleting a room drops cached grants for all of its members."""
+    with flask_app.app_context():
+        owner_id, member_id, room_id, _ = _create_room_with_member()
+
+    _login(test_client, member_id)
+    assert test_client.get(f"/api/library/storage/stats?room_id={room_id}").status_code == 200
+
+    with flask_app.app_context():
+        from src.app.room.services.room_service import RoomService
+        assert RoomService.delete_room(room_id, User.query.get(owner_id)).success
+
+    assert test_client.get(f"/api/library/storage/stats?room_id={room_id}").status_code == 403
+
+
+def test_denials_are_not_cached(test_client):
+    """A newly added member is let in on their next request."""
+    with flask_app.app_context():
+        owner_id, member_id, room_id, _ = _create_room_with_member()
+        outsider_id = _create_user("outsider")
+
+    _login(test_client, outsider_id)
+    assert test_client.get(f"/api/library/storage/stats?room_id={room_id}").status_code == 403
+
+    with flask_app.app_context():
+        db.session.add(RoomMember(room_id=room_id, user_id=outsider_id))
+        db.session.commit()
+
+    assert test_client.get(f"/api/library/storage/stats?room_id={room_id}").status_code == 200
+
+
+def test_invalidate_by_room_drops_every_users_grant(test_client):
+    """invalidate(None, room_id) forgets all grants for that room only."""
+    with library_access._ACCESS_CACHE_LOCK:
+        library_access._ACCESS_CACHE[(1, 10)] = True
+        library_access._ACCESS_CACHE[(2, 10)] = True
+        library_access._ACCESS_CACHE[(1, 11)] = True
+
+    library_access.invalidate(None, 10)
+
+    assert set(library_access._ACCESS_CACHE.keys()) == {(1, 11)}
+
+
+def _fake_process_upload(tmp_path, original_filename, content_type, file_id, *args):
+    os.unlink(tmp_path)
+    return {'fileId': file_id, 'chunkCount': 1}, 200
+
+
+def _poll_until_done(client, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        resp = client.get(f"/api/library/upload/jobs/{job_id}")
+        if resp.status_code != 200 or resp.get_json()["status"] == "done" or time.monotonic() > deadline:
+            return resp
+        time.sleep(0.05)
+
+
+def test_async_upload_returns_202_and_job_can_be_polled(test_client, monkeypatch):
+    """?async=1 answers 202 with a job ID whose result is readable from the database."""
+    monkeypatch.setattr("src.app.library.upload._process_upload", _fake_process_upload)
+    with flask_app.app_context():
+        owner_id, _, room_id, _ = _create_room_with_member()
+
+    _login(test_client, owner_id)
+    resp = test_client.post(
+        f"/api/library/upload?room_id={room_id}&async=1",
+        data={"file": (io.BytesIO(b"hello library"), "notes.txt")},
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 202
+    body = resp.get_json()
+    assert body["status"] == "queued"
+
+    with flask_app.app_context():
+        assert UploadStatus.query.get(body["jobId"]).owner_id == owner_id
+
+    resp = _poll_until_done(test_client, body["jobId"])
+    assert resp.status_code == 200
+    job = resp.get_json()
+    assert job["status"] == "done"
+    assert job["httpStatus"] == 200
+    assert job["result"]["fileId"] == body["fileId"]
+
+
+def test_upload_job_is_hidden_from_other_users(test_client):
+    """Only the user who started a job can read it."""
+    with flask_app.app_context():
+        owner_id, member_id, _, _ = _create_room_with_member()
+        db.session.add(UploadStatus(id="job-1", owner_id=owner_id, status="queued"))
+        db.session.commit()
+
+    _login(test_client, member_id)
+    assert test_client.get("/api/library/upload/jobs/job-1").status_code == 404
+    assert test_client.get("/api/library/upload/jobs/unknown").status_code == 404
+
+    _login(test_client, owner_id)
+    assert test_client.get("/api/library/upload/jobs/job-1").get_json()["status"] == "queued"
+
+
+def test_interrupted_upload_job_fails_and_removes_spooled_file(test_client):
+    """A job left unfinished by a dead worker is reported as failed and its temp file removed."""
+    fd, tmp_path = tempfile.mkstemp(prefix="library-upload-")
+    os.close(fd)
+    stale = datetime.now(timezone.utc) - timedelta(hours=1)
+    with flask_app.app_context():
+        owner_id, _, _, _ = _create_room_with_member()
+        db.session.add(UploadStatus(
+            id="job-lost", owner_id=owner_id, status="running",
+            tmp_path=tmp_path, created_at=stale, updated_at=stale,
+        ))
+        db.session.commit()
+
+    _login(test_client, owner_id)
+    job = test_client.get("/api/library/upload/jobs/job-lost").get_json()
+    assert job["status"] == "done"
+    assert job["httpStatus"] == 500
+    assert not os.path.exists(tmp_path)
+
+
+def test_queued_upload_job_waiting_for_a_worker_is_not_failed(test_client):
+    """A queued job is only waiting for the pool, so an old updated_at does not mark it lost."""
+    fd, tmp_path = tempfile.mkstemp(prefix="library-upload-")
+    os.close(fd)
+    waiting = datetime.now(timezone.utc) - timedelta(hours=1)
+    with flask_app.app_context():
+        owner_id, _, _, _ = _create_room_with_member()
+        db.session.add(UploadStatus(
+            id="job-waiting", owner_id=owner_id, status="queued",
+            tmp_path=tmp_path, created_at=waiting, updated_at=waiting,
+        ))
+        db.session.commit()
+
+    _login(test_client, owner_id)
+    try:
+        job = test_client.get("/api/library/upload/jobs/job-waiting").get_json()
+        assert job["status"] == "queued"
+        assert os.path.exists(tmp_path)
+    finally:
+        os.remove(tmp_path)
+
+
+def test_finished_upload_job_is_not_restarted(test_client):
+    """A worker picking up a job that was already failed leaves it done."""
+    from src.app.library.jobs import _start_job
+
+    with flask_app.app_context():
+        owner_id, _, _, _ = _create_room_with_member()
+        db.session.add(UploadStatus(id="job-failed", owner_id=owner_id, status="done", http_status=500))
+        db.session.commit()
+
+        assert _start_job("job-failed") is False
+        assert db.session.get(UploadStatus, "job-failed").status == "done"
+
+
+def _batch_files(*sizes):
+    return {"files": [(io.BytesIO(b"x" * size), f"doc{i}.txt") for i, size in enumerate(sizes)]}
+
+
+def _recording_save_upload(monkeypatch, fail_on_call=None):
+    """Wrap _save_upload to record spooled paths, optionally failing on the Nth call."""
+    from src.app.library import upload as upload_module
+    real_save = upload_module._save_upload
+    paths = []
+
+    def save(file):
+        if fail_on_call is not None and len(paths) + 1 == fail_on_call:
+            raise OSError("disk full")
+        paths.append(real_save(file))
+        return paths[-1]
+
+    monkeypatch.setattr(upload_module, "_save_upload", save)
+    return paths
+
+
+def _room_remaining(monkeypatch, remaining_bytes):
+    monkeypatch.setattr(
+        "src.app.library.upload.get_room_storage_usage",
+        lambda room_id: {"remaining_bytes": remaining_bytes},
+    )
+
+
+def test_batch_upload_queues_a_job_per_file(test_client, monkeypatch):
+    """upload_batch answers 202 with one pollable job per file."""
+    monkeypatch.setattr("src.app.library.upload._process_upload", _fake_process_upload)
+    with flask_app.app_context():
+        owner_id, _, room_id, _ = _create_room_with_member()
+
+    _login(test_client, owner_id)
+    resp = test_client.post(
+        f"/api/library/upload_batch?room_id={room_id}",
+        data=_batch_files(5, 7),
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 202
+    jobs = resp.get_json()["jobs"]
+    assert [job["fileName"] for job in jobs] == ["doc0.txt", "doc1.txt"]
+    for job in jobs:
+        assert _poll_until_done(test_client, job["jobId"]).get_json()["httpStatus"] == 200
+
+
+def test_batch_upload_rejects_oversized_body_before_spooling(test_client, monkeypatch):
+    """A batch whose Content-Length exceeds the room's remaining storage gets 413 unread."""
+    _room_remaining(monkeypatch, 10)
+    paths = _recording_save_upload(monkeypatch)
+    with flask_app.app_context():
+        owner_id, _, room_id, _ = _create_room_with_member()
+
+    _login(test_client, owner_id)
+    resp = test_client.post(
+        f"/api/library/upload_batch?room_id={room_id}",
+        data=_batch_files(64 * 1024),
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 413
+    assert paths == []
+
+
+def test_batch_upload_rejects_too_many_files(test_client, monkeypatch):
+    """A batch over MAX_BATCH_FILES gets 400 before any file is spooled or queued."""
+    from src.app.library.upload import MAX_BATCH_FILES
+
+    paths = _recording_save_upload(monkeypatch)
+    with flask_app.app_context():
+        owner_id, _, room_id, _ = _create_room_with_member()
+
+    _login(test_client, owner_id)
+    resp = test_client.post(
+        f"/api/library/upload_batch?room_id={room_id}",
+        data=_batch_files(*[1] * (MAX_BATCH_FILES + 1)),
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 400
+    assert paths == []
+    with flask_app.app_context():
+        assert UploadStatus.query.count() == 0
+
+
+def test_batch_upload_over_quota_removes_spooled_files(test_client, monkeypatch):
+    """Files spooled before the exact quota check are deleted when the batch is refused."""
+    _room_remaining(monkeypatch, 10)
+    paths = _recording_save_upload(monkeypatch)
+    with flask_app.app_context():
+        owner_id, _, room_id, _ = _create_room_with_member()
+
+    _login(test_client, owner_id)
+    resp = test_client.post(
+        f"/api/library/upload_batch?room_id={room_id}",
+        data=_batch_files(8, 8),
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 400
+    assert len(paths) == 2
+    assert not any(os.path.exists(path) for path in paths)
+    with flask_app.app_context():
+        assert UploadStatus.query.count() == 0
+
+
+def test_batch_upload_spool_failure_removes_earlier_files(test_client, monkeypatch):
+    """If spooling fails partway, files already written are deleted."""
+    paths = _recording_save_upload(monkeypatch, fail_on_call=2)
+    with flask_app.app_context():
+        owner_id, _, room_id, _ = _create_room_with_member()
+
+    _login(test_client, owner_id)
+    resp = test_client.post(
+        f"/api/library/upload_batch?room_id={room_id}",
+        data=_batch_files(5, 5, 5),
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 500
+    assert len(paths) == 1
+    assert not os.path.exists(paths[0])
+
+
+def test_search_request_coerces_numeric_fields():
+    """limit and min_rank from JSON (numbers or numeric strings) are coerced."""
+    params = SearchRequest.from_json({"query": "  photosynthesis ", "limit": "3", "min_rank": 0.2})
+    assert params == SearchRequest(query="photosynthesis", limit=3, min_rank=0.2)
+    assert SearchRequest.from_json({"query": "cells"}) == SearchRequest(query="cells")
+
+
+@pytest.mark.parametrize("body, message", [
+    ({}, "Query is required"),
+    ({"query": "   "}, "Query cannot be empty"),
+    ({"query": 42}, "Query cannot be empty"),
+    ({"query": "cells", "limit": "many"}, "limit and min_rank must be numbers"),
+    ({"query": "cells", "min_rank": None}, "limit and min_rank must be numbers"),
+    ({"query": "cells", "limit": 0}, "limit must be at least 1"),
+])
+def test_search_request_rejects_invalid_bodies(body, message):
+    with pytest.raises(ValueError, match=message):
+        SearchRequest.from_json(body)
+
+
+def test_clear_request_ids():
+    """Missing/empty ids clear the whole room; ids must otherwise be a list."""
+    assert ClearRequest.from_json({}).ids is None
+    assert ClearRequest.from_json({"ids": []}).ids is None
+    assert ClearRequest.from_json({"ids": ["a", 7]}).ids == ["a", "7"]
+    with pytest.raises(ValueError, match="ids must be a list"):
+        ClearRequest.from_json({"ids": "a"})
+
+
+def test_search_endpoint_rejects_non_numeric_limit(test_client):
+    """The search endpoint answers 400 for a bad limit instead of failing later."""
+    with flask_app.app_context():
+        owner_id, _, room_id, _ = _create_room_with_member()
+
+    _login(test_client, owner_id)
+    resp = test_client.post(
+        "/api/library/search",
+        json={"room_id": room_id, "query": "cells", "limit": "many"},
+    )
+    assert resp.status_code == 400
+    assert resp.get_json()["error"] == "limit and min_rank must be numbers"